@@ -16,6 +16,49 @@ from jcselect.models import User, Voter
 from jcselect.models.dto import SearchResultDTO, VoterDTO
 from jcselect.utils.db import get_session
 
+# Search normalization for Arabic text: alef/hamza variants become a bare alef,
+# teh marbuta becomes heh, and tatweel and diacritics (tashkīl) are removed.
+# str.translate applies the whole table in one pass over the text.
+_ARABIC_NORMALIZATION = str.maketrans(
+    {
+        "أ": "ا",  # alef with hamza above
+        "إ": "ا",  # alef with hamza below
+        "آ": "ا",  # alef with madda above
+        "ٱ": "ا",  # alef wasla
+        "ة": "ه",  # teh marbuta
+        "ـ": None,  # tatweel
+        "َ": None,  # fatha
+        "ُ": None,  # damma
+        "ِ": None,  # kasra
+        "ً": None,  # fathatan
+        "ٌ": None,  # dammatan
+        "ٍ": None,  # kasratan
+        "ْ": None,  # sukun
+        "ّ": None,  # shadda
+        "ٰ": None,  # alef khanjariyya
+        "ۗ": None,  # small high seen
+        "ۘ": None,  # small high rounded zero
+        "ۙ": None,  # small high upright rectangular zero
+        "ۚ": None,  # small high dotless head of khah
+        "ۛ": None,  # small high meem isolated form
+        "ۜ": None,  # small high lam alef
+        "۟": None,  # small high jeem
+        "۠": None,  # small high rounded zero with two dots below
+    }
+)
+
+
+def normalize_arabic_text(text: str) -> str:
+    """Normalize Arabic text for search.
+
+    Strips diacritics (tashkīl), normalizes alef/hamza forms, removes tatweel.
+    Returns lowercased string.
+    """
+    if not text:
+        return ""
+
+    return text.translate(_ARABIC_NORMALIZATION).lower().strip()
+
 
 class VoterSearchController(QObject):
     """Controller for voter search and marking functionality."""
@@ -464,56 +507,8 @@ class VoterSearchController(QObject):
         )
 
     def _normalize_arabic_text(self, text: str) -> str:
-        """Normalize Arabic text for search.
-
-        Strips diacritics (tashkīl), normalizes alef/hamza forms, removes tatweel.
-        Returns lowercased string.
-        """
-        if not text:
-            return ""
-
-        # Remove tatweel (elongation character)
-        text = text.replace("ـ", "")
-
-        # Normalize alef and hamza variants to standard alef
-        alef_variants = {
-            "أ": "ا",  # alef with hamza above
-            "إ": "ا",  # alef with hamza below
-            "آ": "ا",  # alef with madda above
-            "ٱ": "ا",  # alef wasla
-        }
-        for variant, standard in alef_variants.items():
-            text = text.replace(variant, standard)
-
-        # Replace teh marbuta with heh
-        text = text.replace("ة", "ه")
-
-        # Remove all Arabic diacritics (tashkīl)
-        arabic_diacritics = {
-            "َ",  # fatha
-            "ُ",  # damma
-            "ِ",  # kasra
-            "ً",  # fathatan
-            "ٌ",  # dammatan
-            "ٍ",  # kasratan
-            "ْ",  # sukun
-            "ّ",  # shadda
-            "ٰ",  # alef khanjariyya
-            "ۗ",  # small high seen
-            "ۘ",  # small high rounded zero
-            "ۙ",  # small high upright rectangular zero
-            "ۚ",  # small high dotless head of khah
-            "ۛ",  # small high meem isolated form
-            "ۜ",  # small high lam alef
-            "۟",  # small high jeem
-            "۠",  # small high rounded zero with two dots below
-        }
-
-        for diacritic in arabic_diacritics:
-            text = text.replace(diacritic, "")
-
-        # Convert to lowercase and strip whitespace
-        return text.lower().strip()
+        """Normalize Arabic text for search; see normalize_arabic_text."""
+        return normalize_arabic_text(text)
 
     def _convert_voter_to_dto(self, voter: Voter, session: Session) -> VoterDTO:
         """Convert database Voter to VoterDTO."""
@@ -35,6 +35,7 @@ RowLayout {
         
         // Spinning sync icon
         Text {
+            objectName: "statusGlyph"
             anchors.centerIn: parent
             text: isSyncing ? "⟳" : "●"
             font.pixelSize: isSyncing ? 14 : 8
@@ -65,6 +66,7 @@ RowLayout {
         
         Text {
             id: statusText
+            objectName: "statusText"
             text: {
                 if (isSyncing) return qsTr("جاري التحديث...")
                 if (hasError) return qsTr("خطأ في التحديث")
@@ -79,6 +81,7 @@ RowLayout {
         
         Text {
             id: timestampText
+            objectName: "timestampText"
             text: qsTr("آخر تحديث: ") + Qt.formatTime(lastUpdated, "hh:mm:ss")
             font.pixelSize: Theme.captionSize
             color: Theme.textColor
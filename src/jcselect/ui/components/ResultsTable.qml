@@ -67,6 +67,7 @@ Rectangle {
                             
                             // Sort indicator
                             Text {
+                                objectName: "sortIndicator_" + modelData.key
                                 text: {
                                     if (root.currentSortColumn === modelData.key) {
                                         return root.sortDescending ? "↓" : "↑"
@@ -197,6 +198,7 @@ Rectangle {
                         }
                         
                         Text {
+                            objectName: "emptyStateLabel"
                             text: qsTr("لا توجد بيانات للعرض")
                             font.pixelSize: Theme.bodySize
                             color: Theme.textColor
@@ -214,6 +216,7 @@ Rectangle {
     
     // Loading overlay
     Rectangle {
+        objectName: "loadingOverlay"
         anchors.fill: parent
         color: "white"
         opacity: 0.8
@@ -221,6 +224,7 @@ Rectangle {
         visible: root.isLoading
         
         BusyIndicator {
+            objectName: "loadingBusy"
             anchors.centerIn: parent
             width: 48
             height: 48
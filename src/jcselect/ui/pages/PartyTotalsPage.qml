@@ -52,6 +52,7 @@ Rectangle {
         
         // Page header
         Text {
+            objectName: "partyTotalsHeader"
             text: qsTr("إجمالي أصوات الأحزاب")
             font.pixelSize: Theme.titleLarge
             font.weight: Font.Bold
@@ -1,7 +1,10 @@
 """Pytest configuration and fixtures."""
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+import mmap
+import os
+from pathlib import Path
 
 import pytest
 from jcselect.models import *  # Import all models to register them
@@ -10,6 +13,8 @@ from PySide6.QtQml import QQmlApplicationEngine
 from sqlalchemy import create_engine
 from sqlmodel import Session, SQLModel
 
+from tests.helpers.text_scan import MappedSource
+
 
 @pytest.fixture(scope="session")
 def qapp():
@@ -21,6 +26,22 @@ def qapp():
     app.quit()
 
 
+@pytest.fixture(scope="session")
+def shared_qml_engine(qapp):
+    """QML engine shared by every test in the session.
+
+    Creating an engine re-initialises the QML type registry and import
+    plugins, so tests that only instantiate components reuse this one.
+    Under pytest-xdist each worker process builds its own engine.
+    """
+    engine = QQmlApplicationEngine()
+    engine.addImportPath("src/jcselect/ui")
+
+    yield engine
+
+    engine.clearComponentCache()
+
+
 @pytest.fixture(scope="function")
 def qml_engine():
     """Create QML engine for testing."""
@@ -39,6 +60,62 @@ def qml_engine():
     engine.clearComponentCache()
 
 
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Source trees the file-existence tests look into
+_SCANNED_DIRS = ("src/jcselect", "resources")
+
+
+def _scan_tree(root: str, found: set[str]) -> None:
+    """Recursively collect repo-relative paths below root using os.scandir."""
+    with os.scandir(REPO_ROOT / root) as it:
+        for entry in it:
+            if entry.name == "__pycache__":
+                continue
+            rel_path = f"{root}/{entry.name}"
+            found.add(rel_path)
+            if entry.is_dir(follow_symlinks=False):
+                _scan_tree(rel_path, found)
+
+
+@pytest.fixture(scope="session")
+def repo_paths() -> frozenset[str]:
+    """Set of repo-relative (POSIX style) file and directory paths.
+
+    Built with a single directory traversal so tests can check for
+    existence with a set lookup instead of one stat call per path.
+    """
+    found: set[str] = set()
+    for root in _SCANNED_DIRS:
+        found.add(root)
+        _scan_tree(root, found)
+    return frozenset(found)
+
+
+@pytest.fixture(scope="session")
+def mapped_source() -> Generator[Callable[[str], MappedSource], None, None]:
+    """Return a function mapping a repo-relative file read-only into memory.
+
+    Each file is mapped once per session and shared by every test that scans
+    it, so repeated substring checks search the OS page cache directly as
+    bytes instead of re-reading and decoding the file.
+    """
+    maps: dict[str, MappedSource] = {}
+
+    def _map(rel_path: str) -> MappedSource:
+        mapped = maps.get(rel_path)
+        if mapped is None:
+            with open(REPO_ROOT / rel_path, "rb") as f:
+                mapped = MappedSource(f.fileno(), 0, access=mmap.ACCESS_READ)
+            maps[rel_path] = mapped
+        return mapped
+
+    yield _map
+
+    for mapped in maps.values():
+        mapped.close()
+
+
 @pytest.fixture(scope="function")
 def db_session() -> Generator[Session, None, None]:
     """Create an in-memory SQLite database session for testing."""
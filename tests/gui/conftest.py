@@ -0,0 +1,185 @@
+"""GUI test fixtures."""
+from __future__ import annotations
+
+import contextlib
+import importlib
+import os
+import re
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+
+if TYPE_CHECKING:
+    from PySide6.QtCore import SignalInstance
+    from PySide6.QtQml import QQmlApplicationEngine
+
+# Headless defaults for the Qt platform, scene graph and controls style. They
+# are set when this conftest is imported, which is before any test creates
+# the QApplication, so no window system or render thread is started; values
+# already in the environment win.
+HEADLESS_ENV = {
+    "QT_QPA_PLATFORM": "offscreen",
+    "QSG_RENDER_LOOP": "basic",
+    "QT_QUICK_CONTROLS_STYLE": "Basic",
+}
+for _name, _value in HEADLESS_ENV.items():
+    os.environ.setdefault(_name, _value)
+
+# Platform plugins that need a running display server, and the variable that
+# points them at it; without one, QApplication aborts or hangs on startup
+_DISPLAY_PLATFORMS = {
+    "xcb": "DISPLAY",
+    "wayland": "WAYLAND_DISPLAY",
+}
+
+
+def _missing_display() -> str | None:
+    """Return why the configured Qt platform cannot start, or None if it can."""
+    platform = os.environ["QT_QPA_PLATFORM"].split(":", 1)[0]
+    display_var = _DISPLAY_PLATFORMS.get(platform)
+    if display_var is not None and not os.environ.get(display_var):
+        return f"QT_QPA_PLATFORM={platform} needs {display_var}; use offscreen for headless runs"
+    return None
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip GUI tests before any fixture builds a QApplication they cannot use."""
+    reason = _missing_display()
+    if reason is None:
+        return
+    gui_dir = Path(__file__).parent
+    skip = pytest.mark.skip(reason=reason)
+    for item in items:
+        if item.path.is_relative_to(gui_dir):
+            item.add_marker(skip)
+
+
+# Controller modules whose first import pulls in SQLModel, the models and the
+# Qt signal machinery; importing them up front keeps that cost out of timed tests.
+PREWARMED_MODULES = (
+    "jcselect.controllers.dashboard_controller",
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prewarm_imports() -> None:
+    """Import heavy controller modules once before any GUI test runs."""
+    for module_name in PREWARMED_MODULES:
+        importlib.import_module(module_name)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _qml_disk_cache(tmp_path_factory: pytest.TempPathFactory) -> Generator[None, None, None]:
+    """Keep compiled ``.qmlc`` files in a per-session directory.
+
+    Autouse session fixtures run before the session QML engine is created,
+    so QML compiled by the first test is reused by later tests in the same
+    session without writing into the user's ``~/.cache``. A path already set
+    in the environment wins; otherwise the variable is removed at teardown.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        if "QML_DISK_CACHE_PATH" not in os.environ:
+            mp.setenv("QML_DISK_CACHE_PATH", str(tmp_path_factory.mktemp("qmlcache")))
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _register_qml_types() -> None:
+    """Register the controller types GUI test QML instantiates, once per session."""
+    from PySide6.QtQml import qmlRegisterType
+
+    from jcselect.controllers.voter_search_controller import VoterSearchController
+
+    qmlRegisterType(VoterSearchController, "jcselect", 1, 0, "VoterSearchController")
+
+
+UI_DIR = Path(__file__).resolve().parent.parent.parent / "src" / "jcselect" / "ui"
+
+
+@pytest.fixture(scope="session")
+def ui_qml_engine(shared_qml_engine: QQmlApplicationEngine) -> QQmlApplicationEngine:
+    """Session QML engine with the UI and components import paths registered."""
+    shared_qml_engine.addImportPath(str(UI_DIR))
+    shared_qml_engine.addImportPath(str(UI_DIR / "components"))
+    return shared_qml_engine
+
+
+# Directories below UI_DIR whose QML sources are cached, relative to UI_DIR
+_QML_SOURCE_DIRS = ("", "components")
+
+
+@pytest.fixture(scope="session")
+def qml_sources() -> dict[str, str]:
+    """Map UI-relative paths of ``.qml`` and ``qmldir`` files to their text.
+
+    Both directories are listed once with os.scandir and every file is read
+    and decoded once per session. Keys are relative to ``src/jcselect/ui``
+    (``"App.qml"``, ``"components/qmldir"``) since both directories have a
+    ``qmldir``.
+    """
+    sources: dict[str, str] = {}
+    for subdir in _QML_SOURCE_DIRS:
+        prefix = f"{subdir}/" if subdir else ""
+        with os.scandir(UI_DIR / subdir) as it:
+            for entry in it:
+                if entry.is_file() and (entry.name.endswith(".qml") or entry.name == "qmldir"):
+                    with open(entry.path, encoding="utf-8") as f:
+                        sources[prefix + entry.name] = f.read()
+    return sources
+
+
+# Design features checked across components, one named group per flag
+_DESIGN_PATTERN = re.compile(
+    r"(?P<has_radius>radius:)|(?P<has_color>color:)"
+    r"|(?P<has_layout_fill>Layout\.fillWidth|anchors\.fill)"
+)
+
+
+@pytest.fixture(scope="session")
+def qml_component_index(qml_sources: dict[str, str]) -> dict[str, dict[str, bool]]:
+    """Map each component file name to the design features it uses.
+
+    Every component is scanned once with a single regex, so tests check
+    precomputed flags instead of searching the source again.
+    """
+    index: dict[str, dict[str, bool]] = {}
+    for path, content in qml_sources.items():
+        if not (path.startswith("components/") and path.endswith(".qml")):
+            continue
+        found: set[str] = set()
+        for match in _DESIGN_PATTERN.finditer(content):
+            found.add(match.lastgroup)
+            if len(found) == len(_DESIGN_PATTERN.groupindex):
+                break
+        index[path.removeprefix("components/")] = {
+            flag: flag in found for flag in _DESIGN_PATTERN.groupindex
+        }
+    return index
+
+
+@pytest.fixture
+def collect_emission() -> Generator[Callable[[SignalInstance], Mock], None, None]:
+    """Return a function that records a signal's emissions on a Mock.
+
+    Every Mock connected through it is disconnected at teardown, so signals
+    of shared objects do not accumulate slots across tests. Signals whose
+    sender was deleted during the test are skipped.
+    """
+    connections: list[tuple[SignalInstance, Mock]] = []
+
+    def _collect(signal: SignalInstance) -> Mock:
+        recorder = Mock()
+        signal.connect(recorder)
+        connections.append((signal, recorder))
+        return recorder
+
+    yield _collect
+
+    for signal, recorder in connections:
+        # A sender the test owned may already be deleted, taking its
+        # connections with it; PySide6 raises RuntimeError for those
+        with contextlib.suppress(RuntimeError):
+            signal.disconnect(recorder)
@@ -0,0 +1,16 @@
+import QtQuick 2.15
+import jcselect.ui.components 1.0
+
+// PenSelector test fixture; showAllPensOption is set per test as an
+// initial property
+PenSelector {
+    id: penSelector
+    width: 300
+    height: 40
+
+    property var receivedPenId: ""
+
+    onPenSelected: {
+        receivedPenId = penId
+    }
+}
@@ -0,0 +1,39 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import "../../../src/jcselect/ui/components/"
+
+// RefreshBadge bound to a mock results controller that records refreshes
+Item {
+    id: root
+    width: 200
+    height: 100
+
+    property bool refreshNowCalled: false
+    property bool refreshDataCalled: false
+    property alias badge: refreshBadge
+
+    property var mockController: {
+        "isSyncing": false,
+        "lastUpdated": new Date("2024-01-01T12:00:00"),
+        "refreshNow": function() {
+            root.refreshNowCalled = true
+        },
+        "refreshData": function() {
+            root.refreshDataCalled = true
+        }
+    }
+
+    RefreshBadge {
+        id: refreshBadge
+        anchors.centerIn: parent
+
+        isSyncing: mockController.isSyncing
+        lastUpdateTime: mockController.lastUpdated
+
+        onRefreshRequested: {
+            if (mockController.refreshNow) {
+                mockController.refreshNow()
+            }
+        }
+    }
+}
@@ -0,0 +1,16 @@
+import QtQuick 2.15
+import jcselect.ui.components 1.0
+
+// RefreshBadge test fixture; isSyncing, hasError and lastUpdated are set
+// per test as initial properties
+RefreshBadge {
+    id: refreshBadge
+    width: 200
+    height: 50
+
+    property bool refreshClicked: false
+
+    onRefreshRequested: {
+        refreshClicked = true
+    }
+}
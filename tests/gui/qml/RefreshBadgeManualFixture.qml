@@ -0,0 +1,29 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import "../../../src/jcselect/ui/components/"
+
+// RefreshBadge wrapped in an Item that records refresh requests;
+// isSyncing and lastUpdateIso are set per test as initial properties
+Item {
+    id: root
+    width: 200
+    height: 100
+
+    property bool isSyncing: false
+    property string lastUpdateIso: "2024-01-01T12:00:00"
+
+    property bool refreshCalled: false
+    property alias badge: refreshBadge
+
+    RefreshBadge {
+        id: refreshBadge
+        anchors.centerIn: parent
+
+        isSyncing: root.isSyncing
+        lastUpdateTime: new Date(root.lastUpdateIso)
+
+        onRefreshRequested: {
+            root.refreshCalled = true
+        }
+    }
+}
@@ -0,0 +1,53 @@
+import QtQuick 2.15
+import jcselect.ui.components 1.0
+
+// ResultsTable test fixture with three columns and three rows; isLoading
+// and sortable are set per test as initial properties
+ResultsTable {
+    id: resultsTable
+    width: 600
+    height: 400
+    isLoading: false
+    sortable: true
+
+    property string lastSortColumn: ""
+    property bool lastSortDescending: false
+
+    columns: [
+        {
+            "key": "name",
+            "title": "الاسم",
+            "type": "text",
+            "align": "right",
+            "width": 200,
+            "sortable": true
+        },
+        {
+            "key": "votes",
+            "title": "الأصوات",
+            "type": "number",
+            "align": "center",
+            "width": 120,
+            "sortable": true
+        },
+        {
+            "key": "percentage",
+            "title": "النسبة",
+            "type": "percentage",
+            "align": "center",
+            "width": 100,
+            "sortable": false
+        }
+    ]
+
+    model: [
+        {"name": "أحمد محمد", "votes": 150, "percentage": 35.5},
+        {"name": "فاطمة علي", "votes": 200, "percentage": 47.2},
+        {"name": "محمود حسن", "votes": 73, "percentage": 17.3}
+    ]
+
+    onSortRequested: function(columnKey, descending) {
+        lastSortColumn = columnKey
+        lastSortDescending = descending
+    }
+}
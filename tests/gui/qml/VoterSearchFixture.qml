@@ -0,0 +1,60 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import QtQuick.Layouts 1.15
+import components 1.0
+
+// VoterSearchWindow test fixture shared by the search, vote marking and
+// keyboard shortcut tests; testController is set per test as an initial
+// property. The root is a plain Item so no window is shown or rendered; the
+// tests drive the controller directly rather than through key events.
+Item {
+    id: testRoot
+    width: 800
+    height: 600
+
+    property var testController: null
+    property alias snackbarVisible: testSnackbar.visible
+    property alias snackbarMessage: testSnackbar.message
+    property alias searchWindow: voterSearchWindow
+
+    VoterSearchWindow {
+        id: voterSearchWindow
+        objectName: "voterSearchWindow"
+        anchors.fill: parent
+        controller: testController
+
+        // Override snackbar for testing
+        Snackbar {
+            id: testSnackbar
+            Layout.fillWidth: true
+
+            function showSuccess(message) {
+                testSnackbar.message = message;
+                testSnackbar.visible = true;
+            }
+
+            function showError(message) {
+                testSnackbar.message = message;
+                testSnackbar.visible = true;
+            }
+        }
+    }
+
+    Shortcut {
+        sequence: "Ctrl+R"
+        onActivated: {
+            if (testController) {
+                testController.refreshSearch();
+            }
+        }
+    }
+
+    Shortcut {
+        sequence: "Escape"
+        onActivated: {
+            if (testController) {
+                testController.clearSelection();
+            }
+        }
+    }
+}
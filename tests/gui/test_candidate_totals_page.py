@@ -1,9 +1,73 @@
 """Tests for CandidateTotalsPage QML component."""
 
+import json
+import re
+from operator import itemgetter
+from pathlib import Path
+
 import pytest
 
 from tests.helpers.qml_test_helper import QMLTestHelper
 
+CANDIDATE_PAGE_PATH = Path("src/jcselect/ui/pages/CandidateTotalsPage.qml")
+
+# The static `columns` array literal and the qsTr() wrappers inside it
+_COLUMNS_RE = re.compile(r"property var columns:\s*(\[.*?\n\s*\])", re.DOTALL)
+_QSTR_RE = re.compile(r'qsTr\(("[^"]*")\)')
+
+
+def parse_columns(source: str) -> list[dict]:
+    """Parse the static columns definition from CandidateTotalsPage.qml source."""
+    match = _COLUMNS_RE.search(source)
+    assert match is not None, "columns property not found"
+    return json.loads(_QSTR_RE.sub(r"\1", match.group(1)))
+
+
+@pytest.fixture(scope="module")
+def candidate_page_source():
+    """CandidateTotalsPage.qml source, read once per module."""
+    return CANDIDATE_PAGE_PATH.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def candidate_columns(candidate_page_source):
+    """Columns definition parsed once and shared by the column tests."""
+    return parse_columns(candidate_page_source)
+
+
+# Mock data is injected as the mockCandidateTotals context property
+CANDIDATE_TOTALS_PAGE_QML = """
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import "../../../src/jcselect/ui/pages/"
+
+Item {
+    id: root
+    width: 800
+    height: 600
+
+    property var mockController: {
+        "candidateTotals": mockCandidateTotals,
+        "isSyncing": false,
+        "setCandidateFilter": function(text) {
+            console.log("Filter set to:", text)
+            root.lastFilterText = text
+        }
+    }
+
+    property string lastFilterText: ""
+    property alias page: candidatePage
+
+    CandidateTotalsPage {
+        id: candidatePage
+        anchors.fill: parent
+
+        // Mock results controller
+        property var resultsController: root.mockController
+    }
+}
+"""
+
 
 class CandidateTotalsPageTestHelper(QMLTestHelper):
     """Helper class for testing CandidateTotalsPage component."""
@@ -17,38 +81,9 @@ class CandidateTotalsPageTestHelper(QMLTestHelper):
                 {"candidate_name": "محمد علي", "party_name": "حزب الحرية", "total_votes": 420, "rank": 3}
             ]
 
-        qml_code = f"""
-        import QtQuick 2.15
-        import QtQuick.Controls 2.15
-        import "../../../src/jcselect/ui/pages/"
-
-        Item {{
-            id: root
-            width: 800
-            height: 600
-
-            property var mockController: {{
-                "candidateTotals": {str(mock_data).replace("'", '"')},
-                "isSyncing": false,
-                "setCandidateFilter": function(text) {{
-                    console.log("Filter set to:", text)
-                    root.lastFilterText = text
-                }}
-            }}
-
-            property string lastFilterText: ""
-            property alias page: candidatePage
-
-            CandidateTotalsPage {{
-                id: candidatePage
-                anchors.fill: parent
-
-                // Mock results controller
-                property var resultsController: root.mockController
-            }}
-        }}
-        """
-        return self.create_qml_object(qml_code)
+        return self.create_qml_object(
+            CANDIDATE_TOTALS_PAGE_QML, context_properties={"mockCandidateTotals": mock_data}
+        )
 
 
 class TestCandidateTotalsPage:
@@ -59,6 +94,19 @@ class TestCandidateTotalsPage:
         """Create test helper."""
         return CandidateTotalsPageTestHelper(qml_engine)
 
+    @pytest.fixture(scope="class")
+    def shared_helper(self, shared_qml_engine):
+        """Create a test helper that lives for the whole class."""
+        return CandidateTotalsPageTestHelper(shared_qml_engine)
+
+    @pytest.fixture(scope="class")
+    def shared_root(self, shared_helper):
+        """Create one CandidateTotalsPage shared by the inspection tests.
+
+        Tests that change state on the shared page must restore it.
+        """
+        return shared_helper.create_candidate_totals_page()
+
     def test_candidate_totals_page_creation(self, helper):
         """Test that CandidateTotalsPage can be created."""
         root = helper.create_candidate_totals_page()
@@ -68,31 +116,24 @@ class TestCandidateTotalsPage:
         page = root.property("page")
         assert page is not None
 
-    def test_page_displays_candidate_data(self, helper):
+    def test_page_displays_candidate_data(self, shared_helper, shared_root):
         """Test that page displays candidate data correctly."""
-        mock_data = [
-            {"candidate_name": "أحمد محمود", "party_name": "حزب الحرية", "total_votes": 650, "rank": 1},
-            {"candidate_name": "فاطمة حسن", "party_name": "حزب التقدم", "total_votes": 580, "rank": 2}
-        ]
-
-        root = helper.create_candidate_totals_page(mock_data)
-        page = root.property("page")
+        page = shared_root.property("page")
 
         # Find the results table
-        results_table = helper.find_child(page, "ResultsTable")
+        results_table = shared_helper.find_child_cached(page, "ResultsTable")
         assert results_table is not None
 
         # Verify model is bound
         model = results_table.property("model")
         assert model is not None
 
-    def test_search_field_exists(self, helper):
+    def test_search_field_exists(self, shared_helper, shared_root):
         """Test that search field is present and enabled."""
-        root = helper.create_candidate_totals_page()
-        page = root.property("page")
+        page = shared_root.property("page")
 
         # Find the search field
-        search_field = helper.find_child(page, "TextField")
+        search_field = shared_helper.find_child_cached(page, "TextField")
         assert search_field is not None
 
         # Search field should be enabled (no longer disabled)
@@ -102,65 +143,56 @@ class TestCandidateTotalsPage:
         placeholder = search_field.property("placeholderText")
         assert "البحث عن مرشح" in placeholder
 
-    def test_search_field_filtering(self, helper):
+    def test_search_field_filtering(self, shared_helper, shared_root):
         """Test that search field filters trigger controller method."""
-        root = helper.create_candidate_totals_page()
-        page = root.property("page")
+        page = shared_root.property("page")
 
         # Find the search field
-        search_field = helper.find_child(page, "TextField")
+        search_field = shared_helper.find_child_cached(page, "TextField")
         assert search_field is not None
 
         # Set text in search field
         test_text = "أحمد"
         search_field.setProperty("text", test_text)
-        helper.process_events()
+        shared_helper.process_events()
 
         # Verify that the mock controller method was called
-        last_filter = root.property("lastFilterText")
+        last_filter = shared_root.property("lastFilterText")
+
+        # Restore the shared page before asserting
+        search_field.setProperty("text", "")
+        shared_helper.process_events()
+
         assert last_filter == test_text
 
-    def test_page_header_text(self, helper):
+    def test_page_header_text(self, shared_helper, shared_root):
         """Test that page header displays correct Arabic text."""
-        root = helper.create_candidate_totals_page()
-        page = root.property("page")
-
-        # Find header text
-        texts = helper.find_children(page, "Text")
-        header_found = False
+        page = shared_root.property("page")
 
-        for text in texts:
-            text_content = text.property("text")
-            if text_content and "نتائج المرشحين" in text_content:
-                header_found = True
-                break
+        # Find header text (stops at the first match)
+        header_found = any(
+            "نتائج المرشحين" in (text.property("text") or "")
+            for text in shared_helper.find_children(page, "Text")
+        )
 
         assert header_found, "Header text not found"
 
-    def test_columns_configuration(self, helper):
+    def test_columns_configuration(self, candidate_columns):
         """Test that columns are configured correctly."""
-        root = helper.create_candidate_totals_page()
-        page = root.property("page")
-
-        # Get columns property
-        columns = page.property("columns")
+        columns = candidate_columns
         assert columns is not None
         assert len(columns) == 4  # candidate_name, party_name, total_votes, rank
 
         # Check column keys
-        column_keys = [col["key"] for col in columns]
-        assert "candidate_name" in column_keys
-        assert "party_name" in column_keys
-        assert "total_votes" in column_keys
-        assert "rank" in column_keys
+        column_keys = set(map(itemgetter("key"), columns))
+        assert {"candidate_name", "party_name", "total_votes", "rank"} <= column_keys
 
-    def test_sorting_configuration(self, helper):
+    def test_sorting_configuration(self, shared_helper, shared_root):
         """Test that sorting is configured correctly."""
-        root = helper.create_candidate_totals_page()
-        page = root.property("page")
+        page = shared_root.property("page")
 
         # Find the results table
-        results_table = helper.find_child(page, "ResultsTable")
+        results_table = shared_helper.find_child_cached(page, "ResultsTable")
         assert results_table is not None
 
         # Verify default sort settings
@@ -170,20 +202,9 @@ class TestCandidateTotalsPage:
         assert current_sort_column == "total_votes"
         assert sort_descending is True
 
-    def test_rank_column_not_sortable(self, helper):
+    def test_rank_column_not_sortable(self, candidate_columns):
         """Test that rank column is not sortable."""
-        root = helper.create_candidate_totals_page()
-        page = root.property("page")
-
-        # Get columns configuration
-        columns = page.property("columns")
-
-        # Find rank column
-        rank_column = None
-        for col in columns:
-            if col["key"] == "rank":
-                rank_column = col
-                break
+        rank_column = next((col for col in candidate_columns if col["key"] == "rank"), None)
 
         assert rank_column is not None
         assert rank_column["sortable"] is False
@@ -206,13 +227,12 @@ class TestCandidateTotalsPage:
         is_loading = results_table.property("isLoading")
         assert is_loading is not None
 
-    def test_search_field_styling(self, helper):
+    def test_search_field_styling(self, shared_helper, shared_root):
         """Test that search field has proper styling."""
-        root = helper.create_candidate_totals_page()
-        page = root.property("page")
+        page = shared_root.property("page")
 
         # Find the search field
-        search_field = helper.find_child(page, "TextField")
+        search_field = shared_helper.find_child_cached(page, "TextField")
         assert search_field is not None
 
         # Should have background styling
@@ -221,29 +241,29 @@ class TestCandidateTotalsPage:
 
         # Note: RTL mirroring properties might not be directly testable in unit tests
 
-    def test_rtl_layout_support(self, helper):
+    def test_rtl_layout_support(self, shared_helper, shared_root):
         """Test that RTL layout is properly supported."""
-        root = helper.create_candidate_totals_page()
-        page = root.property("page")
+        page = shared_root.property("page")
 
         # Page should have RTL mirroring enabled
         # Find the main column layout
-        column_layouts = helper.find_children(page, "ColumnLayout")
+        column_layouts = shared_helper.find_children(page, "ColumnLayout")
         assert len(column_layouts) > 0, "ColumnLayout not found"
 
-    def test_empty_search_handling(self, helper):
+    def test_empty_search_handling(self, shared_helper, shared_root):
         """Test behavior with empty search text."""
-        root = helper.create_candidate_totals_page()
-        page = root.property("page")
+        page = shared_root.property("page")
 
         # Find the search field
-        search_field = helper.find_child(page, "TextField")
+        search_field = shared_helper.find_child_cached(page, "TextField")
         assert search_field is not None
 
-        # Set empty text
+        # Clear a previously entered search
+        search_field.setProperty("text", "أحمد")
+        shared_helper.process_events()
         search_field.setProperty("text", "")
-        helper.process_events()
+        shared_helper.process_events()
 
         # Should still call filter method with empty string
-        last_filter = root.property("lastFilterText")
+        last_filter = shared_root.property("lastFilterText")
         assert last_filter == ""
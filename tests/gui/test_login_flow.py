@@ -1,225 +1,162 @@
 """Test login flow and dashboard routing."""
 from __future__ import annotations
 
+import importlib.util
 import os
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
-# Skip GUI tests on CI if display isn't available
-try:
-    from PySide6.QtCore import QCoreApplication, QTimer
-    from PySide6.QtGui import QGuiApplication
-    from PySide6.QtQml import QQmlApplicationEngine
-    GUI_AVAILABLE = True
-except Exception:
-    GUI_AVAILABLE = False
+# Skip GUI tests on CI if display isn't available; probing the spec avoids
+# importing the Qt modules just to decide that
+GUI_AVAILABLE = importlib.util.find_spec("PySide6") is not None
+
+# Imported once per worker; these pull in SQLModel and the Qt bindings, so the
+# whole module is skipped if they are unavailable
+login_controller_mod = pytest.importorskip("jcselect.controllers.login_controller")
+dashboard_controller_mod = pytest.importorskip("jcselect.controllers.dashboard_controller")
+from jcselect.main import DASHBOARD_AVAILABLE  # noqa: E402
 
 # Check if we have a display
 DISPLAY_AVAILABLE = os.environ.get("DISPLAY") is not None or sys.platform == "win32"
 
 
+# Shared by the cached-credential scenarios, which differ only in the pen
+_MOCK_USER_INFO = MagicMock(username="cached_user", role="operator")
+
+
+def _make_cached_creds(pen_id: str | None) -> MagicMock:
+    """Cached credentials for the shared user with the given selected pen."""
+    return MagicMock(user_info=_MOCK_USER_INFO, selected_pen_id=pen_id)
+
+
+def _make_auth_cache(pen_id: str | None) -> MagicMock:
+    """AuthCache mock holding valid, refreshable cached credentials."""
+    mock_cache = MagicMock()
+    mock_cache.load_credentials.return_value = _make_cached_creds(pen_id)
+    mock_cache.can_refresh_token.return_value = True
+    mock_cache.is_token_valid.return_value = True
+    return mock_cache
+
+
+@pytest.fixture(scope="session")
+def login_controller(qapp):
+    """Shared LoginController for tests that don't patch its collaborators."""
+    return login_controller_mod.LoginController()
+
+
+@pytest.fixture(scope="session")
+def dashboard_controller(qapp):
+    """Shared DashboardController for read-only tests."""
+    return dashboard_controller_mod.DashboardController()
+
+
 @pytest.mark.qt
 @pytest.mark.skipif(not GUI_AVAILABLE or not DISPLAY_AVAILABLE, reason="GUI not available or no display")
 class TestLoginFlow:
     """Test application login flow and routing."""
 
-    def test_operator_mode_loads_operator_dashboard(self):
+    def test_dashboard_controllers_available(self, login_controller, dashboard_controller):
+        """Test that the dashboard and login controllers are available in any mode."""
+        assert DASHBOARD_AVAILABLE, "Dashboard controllers should be available"
+        assert login_controller is not None
+        assert dashboard_controller is not None
+        
+        print("✅ Dashboard controllers tested successfully")
+
+    def test_operator_mode_loads_operator_dashboard(self, monkeypatch):
         """Test that operator mode loads the operator dashboard after login."""
-        # Set operator mode environment
-        os.environ["JCSELECT_MODE"] = "operator"
-        os.environ["JCSELECT_REQUIRED_ROLE"] = "operator"
+        # Set operator mode environment (restored by monkeypatch)
+        monkeypatch.setenv("JCSELECT_MODE", "operator")
+        monkeypatch.setenv("JCSELECT_REQUIRED_ROLE", "operator")
         
-        try:
-            # Test that we can create the main module components
-            from jcselect.main import DASHBOARD_AVAILABLE
-            
-            assert DASHBOARD_AVAILABLE, "Dashboard controllers should be available"
-            
-            # Test that the environment variables are set correctly
-            assert os.environ.get("JCSELECT_MODE") == "operator"
-            assert os.environ.get("JCSELECT_REQUIRED_ROLE") == "operator"
-            
-            # Test that we can create controllers
-            from jcselect.controllers.login_controller import LoginController
-            from jcselect.controllers.dashboard_controller import DashboardController
-            
-            login_controller = LoginController()
-            dashboard_controller = DashboardController()
-            
-            assert login_controller is not None
-            assert dashboard_controller is not None
-            
-            print("✅ Operator mode environment and controllers tested successfully")
-                     
-        finally:
-            # Clean up environment
-            if "JCSELECT_MODE" in os.environ:
-                del os.environ["JCSELECT_MODE"]
-            if "JCSELECT_REQUIRED_ROLE" in os.environ:
-                del os.environ["JCSELECT_REQUIRED_ROLE"]
-
-    def test_admin_mode_loads_admin_dashboard(self):
+        # Test that the environment variables are set correctly
+        assert os.environ.get("JCSELECT_MODE") == "operator"
+        assert os.environ.get("JCSELECT_REQUIRED_ROLE") == "operator"
+        
+        print("✅ Operator mode environment tested successfully")
+
+    def test_admin_mode_loads_admin_dashboard(self, monkeypatch):
         """Test that admin mode loads the admin dashboard after login."""
-        # Set admin mode environment
-        os.environ["JCSELECT_MODE"] = "admin"
-        os.environ["JCSELECT_REQUIRED_ROLE"] = "admin"
+        # Set admin mode environment (restored by monkeypatch)
+        monkeypatch.setenv("JCSELECT_MODE", "admin")
+        monkeypatch.setenv("JCSELECT_REQUIRED_ROLE", "admin")
         
-        try:
-            # Test that we can create the main module components
-            from jcselect.main import DASHBOARD_AVAILABLE
-            
-            assert DASHBOARD_AVAILABLE, "Dashboard controllers should be available"
-            
-            # Test that the environment variables are set correctly
-            assert os.environ.get("JCSELECT_MODE") == "admin"
-            assert os.environ.get("JCSELECT_REQUIRED_ROLE") == "admin"
-            
-            # Test that we can create controllers
-            from jcselect.controllers.login_controller import LoginController
-            from jcselect.controllers.dashboard_controller import DashboardController
-            
-            login_controller = LoginController()
-            dashboard_controller = DashboardController()
-            
-            assert login_controller is not None
-            assert dashboard_controller is not None
-            
-            print("✅ Admin mode environment and controllers tested successfully")
-                     
-        finally:
-            # Clean up environment
-            if "JCSELECT_MODE" in os.environ:
-                del os.environ["JCSELECT_MODE"]
-            if "JCSELECT_REQUIRED_ROLE" in os.environ:
-                del os.environ["JCSELECT_REQUIRED_ROLE"]
-
-    def test_cached_credentials_enable_auto_login(self):
-        """Test that cached credentials enable automatic login."""
-        try:
-            # Mock auth cache with valid credentials
-            with patch('jcselect.controllers.login_controller.AuthCache') as MockAuthCache:
-                mock_cache = MagicMock()
-                mock_cache.load_credentials.return_value = MagicMock(
-                    user_info=MagicMock(
-                        username="cached_user",
-                        role="operator"
-                    ),
-                    selected_pen_id="cached_pen"
-                )
-                mock_cache.can_refresh_token.return_value = True
-                mock_cache.is_token_valid.return_value = True
-                MockAuthCache.return_value = mock_cache
-                
-                # Test login controller creation
-                from jcselect.controllers.login_controller import LoginController
-                login_controller = LoginController()
-                
-                # Test auto-login
-                result = login_controller.autoLoginIfPossible()
-                
-                # Should succeed with cached credentials
-                assert result, "Auto-login should succeed with valid cached credentials"
-                
-                print("✅ Cached credentials auto-login tested successfully")
-                
-        except ImportError as e:
-            pytest.skip(f"Login controller not available: {e}")
-
-    def test_failed_login_shows_error(self):
+        # Test that the environment variables are set correctly
+        assert os.environ.get("JCSELECT_MODE") == "admin"
+        assert os.environ.get("JCSELECT_REQUIRED_ROLE") == "admin"
+        
+        print("✅ Admin mode environment tested successfully")
+
+    @pytest.mark.parametrize(
+        "pen_id", ["cached_pen", None], ids=["cached_pen", "no_cached_pen"]
+    )
+    def test_cached_credentials_login_flow(self, monkeypatch, pen_id):
+        """Test auto-login with cached credentials, and pen selection when no pen is cached."""
+        MockAuthCache = MagicMock(return_value=_make_auth_cache(pen_id))
+        monkeypatch.setattr(login_controller_mod, "AuthCache", MockAuthCache)
+        
+        # Test login controller creation
+        login_controller = login_controller_mod.LoginController()
+        
+        if pen_id is not None:
+            # Should succeed with cached credentials
+            result = login_controller.autoLoginIfPossible()
+            assert result, "Auto-login should succeed with valid cached credentials"
+            print("✅ Cached credentials auto-login tested successfully")
+        else:
+            # Should emit penSelectionRequired signal
+            # In a real test, we'd check the signal emission
+            print("✅ Pen selection required flow tested successfully")
+
+    def test_failed_login_shows_error(self, monkeypatch):
         """Test that failed login shows error message."""
-        try:
-            # Test login controller creation
-            from jcselect.controllers.login_controller import LoginController
-            
-            with patch('jcselect.controllers.login_controller.APIClient') as MockAPIClient:
-                # Mock failed API response
-                mock_client = MagicMock()
-                mock_client.post.side_effect = Exception("Connection failed")
-                MockAPIClient.return_value = mock_client
-                
-                login_controller = LoginController()
-                
-                # Test failed authentication
-                login_controller.authenticate("invalid_user", "invalid_pass", False)
-                
-                # Should emit loginFailed signal
-                # In a real test, we'd check the signal emission
-                print("✅ Failed login error handling tested successfully")
-                
-        except ImportError as e:
-            pytest.skip(f"Login controller not available: {e}")
-
-    def test_pen_selection_required_flow(self):
-        """Test that pen selection is required when no pen is cached."""
-        try:
-            # Mock successful auth but no pen
-            with patch('jcselect.controllers.login_controller.AuthCache') as MockAuthCache:
-                mock_cache = MagicMock()
-                mock_cache.load_credentials.return_value = MagicMock(
-                    user_info=MagicMock(
-                        username="no_pen_user",
-                        role="operator"
-                    ),
-                    selected_pen_id=None  # No pen cached
-                )
-                mock_cache.can_refresh_token.return_value = True
-                mock_cache.is_token_valid.return_value = True
-                MockAuthCache.return_value = mock_cache
-                
-                # Test login controller creation
-                from jcselect.controllers.login_controller import LoginController
-                login_controller = LoginController()
-                
-                # Should emit penSelectionRequired signal
-                # In a real test, we'd check the signal emission
-                print("✅ Pen selection required flow tested successfully")
-                
-        except ImportError as e:
-            pytest.skip(f"Login controller not available: {e}")
-
-    def test_navigation_between_screens(self):
+        MockAPIClient = MagicMock()
+        monkeypatch.setattr(login_controller_mod, "APIClient", MockAPIClient)
+        # Mock failed API response
+        mock_client = MagicMock()
+        mock_client.post.side_effect = Exception("Connection failed")
+        MockAPIClient.return_value = mock_client
+        
+        login_controller = login_controller_mod.LoginController()
+        
+        # Test failed authentication
+        login_controller.authenticate("invalid_user", "invalid_pass", False)
+        
+        # Should emit loginFailed signal
+        # In a real test, we'd check the signal emission
+        print("✅ Failed login error handling tested successfully")
+
+    def test_navigation_between_screens(self, dashboard_controller):
         """Test navigation between different application screens."""
-        try:
-            # Mock dashboard controller
-            from jcselect.controllers.dashboard_controller import DashboardController
-            dashboard_controller = DashboardController()
-            
-            # Test navigation methods exist
-            assert hasattr(dashboard_controller, 'openVoterSearch')
-            assert hasattr(dashboard_controller, 'openTallyCounting')
-            assert hasattr(dashboard_controller, 'openTurnoutReports')
-            assert hasattr(dashboard_controller, 'openResultsCharts')
-            assert hasattr(dashboard_controller, 'openWinners')
-            assert hasattr(dashboard_controller, 'openCountOperations')
-            assert hasattr(dashboard_controller, 'openSetup')
-            assert hasattr(dashboard_controller, 'openSystemSettings')
-            assert hasattr(dashboard_controller, 'switchUser')
-            
-            print("✅ Navigation methods tested successfully")
-            
-        except ImportError as e:
-            pytest.skip(f"Dashboard controller not available: {e}")
+        # Test navigation methods exist (one dir() call and a set subset check)
+        required = {
+            "openVoterSearch",
+            "openTallyCounting",
+            "openTurnoutReports",
+            "openResultsCharts",
+            "openWinners",
+            "openCountOperations",
+            "openSetup",
+            "openSystemSettings",
+            "switchUser",
+        }
+        missing = required - set(dir(dashboard_controller))
+        assert not missing, f"Missing navigation methods: {sorted(missing)}"
+        
+        print("✅ Navigation methods tested successfully")
 
-    def test_qml_components_can_be_loaded(self):
+    def test_qml_components_can_be_loaded(self, shared_qml_engine, repo_paths):
         """Test that QML components can be loaded without errors."""
         try:
-            # Test that we can create QML engine
-            if QGuiApplication.instance() is None:
-                app = QGuiApplication([])
-            
-            engine = QQmlApplicationEngine()
-            
-            # Test that we can load QML files
-            from pathlib import Path
-            ui_path = Path(__file__).parent.parent.parent / "src" / "jcselect" / "ui"
+            # Test that we have a QML engine (shared across the session)
+            assert shared_qml_engine is not None
             
-            # Check that key files exist
-            assert (ui_path / "LoginWindow.qml").exists(), "LoginWindow.qml should exist"
-            assert (ui_path / "AdminDashboard.qml").exists(), "AdminDashboard.qml should exist"
-            assert (ui_path / "OperatorDashboard.qml").exists(), "OperatorDashboard.qml should exist"
-            assert (ui_path / "App.qml").exists(), "App.qml should exist"
+            # Check that key files exist (one set check against the scanned tree)
+            required = {"LoginWindow.qml", "AdminDashboard.qml", "OperatorDashboard.qml", "App.qml"}
+            missing = {f"src/jcselect/ui/{name}" for name in required} - repo_paths
+            assert not missing, f"Missing QML files: {sorted(missing)}"
             
             print("✅ QML components existence tested successfully")
             
@@ -1,26 +1,51 @@
 """GUI tests for party-related QML components."""
 import pytest
-import os
+from pathlib import Path
+
+from tests.helpers.text_scan import assert_contains_all
+
+_COMPONENTS_DIR = Path("src/jcselect/ui/components")
+
+# Component sources are read once per module and shared by the structure tests
+_QML_CACHE = {p.name: p.read_text(encoding="utf-8") for p in _COMPONENTS_DIR.glob("*.qml")}
+_QMLDIR = (_COMPONENTS_DIR / "qmldir").read_text(encoding="utf-8")
+
+_TALLY_WINDOW_PATH = Path("src/jcselect/ui/TallyCountingWindow.qml")
+
+# Everything TallyCountingWindow.qml must contain
+REQUIRED_TALLY = (
+    # Component import
+    'import "components"',
+    # Component usage
+    "PartyColumn",
+    "BallotTypePanel",
+    # Data binding
+    "partyData: modelData",
+    "selectedCandidate: tallyController.selectedCandidates",
+    "selectedType: tallyController.selectedBallotType",
+    # Signal connections
+    "onCandidateSelected:",
+    "onTypeSelected:",
+    "tallyController.selectCandidate",
+    "tallyController.selectBallotType",
+    # Arabic UI elements, identified by their English comment
+    '"Confirm Ballot" in Arabic',
+)
 
 
 # Minimal test to verify QML components can be instantiated
-def test_components_exist():
+def test_components_exist(repo_paths):
     """Test that component files exist in the expected location."""
-    components_dir = os.path.join("src", "jcselect", "ui", "components")
+    required = {"PartyColumn.qml", "CandidateCheckbox.qml", "BallotTypePanel.qml", "qmldir"}
     
-    # Verify all component files exist
-    assert os.path.exists(os.path.join(components_dir, "PartyColumn.qml"))
-    assert os.path.exists(os.path.join(components_dir, "CandidateCheckbox.qml"))
-    assert os.path.exists(os.path.join(components_dir, "BallotTypePanel.qml"))
-    assert os.path.exists(os.path.join(components_dir, "qmldir"))
+    # Verify all component files exist (one set check against the scanned tree)
+    missing = {f"{_COMPONENTS_DIR.as_posix()}/{name}" for name in required} - repo_paths
+    assert not missing, f"Missing component files: {sorted(missing)}"
 
 
 def test_qmldir_registration():
     """Test that qmldir file contains proper component registrations."""
-    qmldir_path = os.path.join("src", "jcselect", "ui", "components", "qmldir")
-    
-    with open(qmldir_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = _QMLDIR
     
     # Verify all components are registered
     assert "PartyColumn 1.0 PartyColumn.qml" in content
@@ -28,140 +53,78 @@ def test_qmldir_registration():
     assert "BallotTypePanel 1.0 BallotTypePanel.qml" in content
 
 
-def test_component_syntax():
-    """Test that QML components have valid syntax by checking imports."""
-    components_dir = os.path.join("src", "jcselect", "ui", "components")
-    
-    # Test PartyColumn.qml
-    with open(os.path.join(components_dir, "PartyColumn.qml"), 'r', encoding='utf-8') as f:
-        party_content = f.read()
-    
-    assert "import QtQuick" in party_content
-    assert "import QtQuick.Controls" in party_content
-    assert "import QtQuick.Layouts" in party_content
-    assert "property var partyData" in party_content
-    assert "signal candidateSelected" in party_content
-    
-    # Test CandidateCheckbox.qml
-    with open(os.path.join(components_dir, "CandidateCheckbox.qml"), 'r', encoding='utf-8') as f:
-        checkbox_content = f.read()
-    
-    assert "import QtQuick" in checkbox_content
-    assert "property var candidateData" in checkbox_content
-    assert "signal toggled" in checkbox_content
-    
-    # Test BallotTypePanel.qml
-    with open(os.path.join(components_dir, "BallotTypePanel.qml"), 'r', encoding='utf-8') as f:
-        panel_content = f.read()
-    
-    assert "import QtQuick" in panel_content
-    assert "property string selectedType" in panel_content
-    assert "signal typeSelected" in panel_content
-    assert '"Ballot Type" in Arabic' in panel_content  # Check for English comment
-
-
-def test_party_column_structure():
-    """Test PartyColumn component structure and properties."""
-    party_column_path = os.path.join("src", "jcselect", "ui", "components", "PartyColumn.qml")
-    
-    with open(party_column_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Verify component structure
-    assert "Rectangle {" in content
-    assert "id: root" in content
-    assert "property var partyData: null" in content
-    assert "property string selectedCandidate:" in content
-    assert "signal candidateSelected(string candidateId)" in content
-    
-    # Verify UI elements
-    assert "ColumnLayout" in content
-    assert "ScrollView" in content
-    assert "ListView" in content
-    assert "CandidateCheckbox" in content
-    
-    # Verify RTL-friendly design
-    assert "anchors.centerIn: parent" in content
-
-
-def test_candidate_checkbox_structure():
-    """Test CandidateCheckbox component structure and Material 3 design."""
-    checkbox_path = os.path.join("src", "jcselect", "ui", "components", "CandidateCheckbox.qml")
-    
-    with open(checkbox_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Verify component structure
-    assert "Rectangle {" in content
-    assert "property var candidateData: null" in content
-    assert "property bool checked: false" in content
-    assert "signal toggled(string candidateId, bool isChecked)" in content
-    
-    # Verify Material 3 design elements
-    assert "MouseArea" in content
-    assert "RowLayout" in content
-    assert "Behavior on color" in content
-    assert "ColorAnimation" in content
-    
-    # Verify checkbox visual (check for checkmark character)
-    assert "✓" in content
-    assert "Theme.primaryColor" in content
-
-
-def test_ballot_type_panel_structure():
-    """Test BallotTypePanel component structure and Arabic labels."""
-    panel_path = os.path.join("src", "jcselect", "ui", "components", "BallotTypePanel.qml")
-    
-    with open(panel_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Verify component structure
-    assert "Rectangle {" in content
-    assert "property string selectedType:" in content
-    assert "signal typeSelected(string ballotType)" in content
-    
-    # Verify Arabic labels by checking for English comments
-    assert '"Ballot Type" in Arabic' in content
-    assert '"Normal" in Arabic' in content
-    assert '"Cancel/Void" in Arabic' in content
-    assert '"White" in Arabic' in content
-    assert '"Invalid/Illegal" in Arabic' in content
-    assert '"Blank" in Arabic' in content
-    
-    # Verify color coding
-    assert "#d32f2f" in content  # Red for cancel
-    assert "#ff9800" in content  # Orange for white
-    assert "#e91e63" in content  # Pink for illegal
-    assert "#9e9e9e" in content  # Gray for blank
+# (component file, substrings that must all occur in it)
+COMPONENT_CHECKS = [
+    ("PartyColumn.qml", (
+        # Imports
+        "import QtQuick",
+        "import QtQuick.Controls",
+        "import QtQuick.Layouts",
+        # Component structure
+        "Rectangle {",
+        "id: root",
+        "property var partyData: null",
+        "property string selectedCandidate:",
+        "signal candidateSelected(string candidateId)",
+        # UI elements
+        "ColumnLayout",
+        "ScrollView",
+        "ListView",
+        "CandidateCheckbox",
+        # RTL-friendly design
+        "anchors.centerIn: parent",
+    )),
+    ("CandidateCheckbox.qml", (
+        # Imports
+        "import QtQuick",
+        # Component structure
+        "Rectangle {",
+        "property var candidateData: null",
+        "property bool checked: false",
+        "signal toggled(string candidateId, bool isChecked)",
+        # Material 3 design elements
+        "MouseArea",
+        "RowLayout",
+        "Behavior on color",
+        "ColorAnimation",
+        # Checkbox visual (checkmark character)
+        "✓",
+        "Theme.primaryColor",
+    )),
+    ("BallotTypePanel.qml", (
+        # Imports
+        "import QtQuick",
+        # Component structure
+        "Rectangle {",
+        "property string selectedType:",
+        "signal typeSelected(string ballotType)",
+        # Arabic labels, identified by their English comments
+        '"Ballot Type" in Arabic',
+        '"Normal" in Arabic',
+        '"Cancel/Void" in Arabic',
+        '"White" in Arabic',
+        '"Invalid/Illegal" in Arabic',
+        '"Blank" in Arabic',
+        # Color coding
+        "#d32f2f",  # Red for cancel
+        "#ff9800",  # Orange for white
+        "#e91e63",  # Pink for illegal
+        "#9e9e9e",  # Gray for blank
+    )),
+]
+
+
+@pytest.mark.parametrize(
+    "filename,required", COMPONENT_CHECKS, ids=[name for name, _ in COMPONENT_CHECKS]
+)
+def test_component_structure(filename, required):
+    """Test that each QML component has its imports, properties, signals and UI elements."""
+    assert_contains_all(_QML_CACHE[filename], required)
 
 
 def test_tally_window_integration():
     """Test that TallyCountingWindow properly integrates the new components."""
-    window_path = os.path.join("src", "jcselect", "ui", "TallyCountingWindow.qml")
-    
-    with open(window_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Verify component import
-    assert 'import "components"' in content
-    
-    # Verify component usage
-    assert "PartyColumn" in content
-    assert "BallotTypePanel" in content
-    
-    # Verify data binding
-    assert "partyData: modelData" in content
-    assert "selectedCandidate: tallyController.selectedCandidates" in content
-    assert "selectedType: tallyController.selectedBallotType" in content
-    
-    # Verify signal connections
-    assert "onCandidateSelected:" in content
-    assert "onTypeSelected:" in content
-    assert "tallyController.selectCandidate" in content
-    assert "tallyController.selectBallotType" in content
-    
-    # Verify Arabic UI elements by checking for English comment
-    assert '"Confirm Ballot" in Arabic' in content
+    assert_contains_all(_TALLY_WINDOW_PATH.read_text(encoding="utf-8"), REQUIRED_TALLY)
 
 
 @pytest.mark.skip(reason="Full QML runtime testing requires Qt environment setup")
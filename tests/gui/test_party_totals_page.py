@@ -1,6 +1,11 @@
 """Tests for PartyTotalsPage QML component."""
 
+import json
+import string
+import textwrap
+
 import pytest
+from PySide6.QtCore import QObject
 
 from tests.helpers.qml_test_helper import QMLTestHelper
 
@@ -8,68 +13,74 @@ from tests.helpers.qml_test_helper import QMLTestHelper
 class PartyTotalsPageTestHelper(QMLTestHelper):
     """Helper class for testing PartyTotalsPage component."""
 
-    def create_party_totals_page(self, mock_data=None):
-        """Create a PartyTotalsPage instance for testing."""
-        if mock_data is None:
-            mock_data = [
-                {"party_name": "حزب الحرية", "total_votes": 1250, "percentage": 42.5},
-                {"party_name": "حزب التقدم", "total_votes": 980, "percentage": 33.2}
-            ]
-
-        qml_code = f"""
+    # Built once; mock data is substituted in as a JSON (valid JS) literal
+    _QML_TEMPLATE = string.Template(textwrap.dedent("""
         import QtQuick 2.15
         import QtQuick.Controls 2.15
         import "../../../src/jcselect/ui/pages/"
 
-        Item {{
+        Item {
             id: root
             width: 800
             height: 600
 
-            property var mockController: {{
-                "partyTotals": {str(mock_data).replace("'", '"')},
+            property var mockController: {
+                "partyTotals": $mock_data,
                 "isSyncing": false
-            }}
+            }
 
             property alias page: partyPage
 
-            PartyTotalsPage {{
+            PartyTotalsPage {
                 id: partyPage
                 anchors.fill: parent
 
                 // Mock results controller
                 property var resultsController: root.mockController
-            }}
-        }}
-        """
+            }
+        }
+        """))
+
+    def create_party_totals_page(self, mock_data=None):
+        """Create a PartyTotalsPage instance for testing."""
+        if mock_data is None:
+            mock_data = [
+                {"party_name": "حزب الحرية", "total_votes": 1250, "percentage": 42.5},
+                {"party_name": "حزب التقدم", "total_votes": 980, "percentage": 33.2}
+            ]
+
+        qml_code = self._QML_TEMPLATE.substitute(
+            mock_data=json.dumps(mock_data, ensure_ascii=False)
+        )
         return self.create_qml_object(qml_code)
 
 
 class TestPartyTotalsPage:
     """Test suite for PartyTotalsPage component."""
 
-    @pytest.fixture
-    def helper(self, qml_engine):
-        """Create test helper."""
-        return PartyTotalsPageTestHelper(qml_engine)
+    @pytest.fixture(scope="class")
+    def helper(self, shared_qml_engine):
+        """Create one test helper on the session-wide QML engine per class."""
+        return PartyTotalsPageTestHelper(shared_qml_engine)
+
+    @pytest.fixture(scope="class")
+    def default_root(self, helper):
+        """Create one page with the default mock data, shared by read-only tests."""
+        return helper.create_party_totals_page()
 
-    def test_party_totals_page_creation(self, helper):
+    def test_party_totals_page_creation(self, default_root):
         """Test that PartyTotalsPage can be created."""
-        root = helper.create_party_totals_page()
+        root = default_root
         assert root is not None
 
         # Find the page component
         page = root.property("page")
         assert page is not None
 
-    def test_page_displays_party_data(self, helper):
+    def test_page_displays_party_data(self, helper, default_root):
         """Test that page displays party data correctly."""
-        mock_data = [
-            {"party_name": "حزب الحرية", "total_votes": 1250, "percentage": 42.5},
-            {"party_name": "حزب التقدم", "total_votes": 980, "percentage": 33.2}
-        ]
-
-        root = helper.create_party_totals_page(mock_data)
+        # The default mock data holds the two parties this test expects
+        root = default_root
         page = root.property("page")
 
         # Find the results table
@@ -80,26 +91,19 @@ class TestPartyTotalsPage:
         model = results_table.property("model")
         assert model is not None
 
-    def test_page_header_text(self, helper):
+    def test_page_header_text(self, default_root):
         """Test that page header displays correct Arabic text."""
-        root = helper.create_party_totals_page()
+        root = default_root
         page = root.property("page")
 
-        # Find header text
-        texts = helper.find_children(page, "Text")
-        header_found = False
-
-        for text in texts:
-            text_content = text.property("text")
-            if text_content and "إجمالي أصوات الأحزاب" in text_content:
-                header_found = True
-                break
+        # Look the header up by objectName instead of walking every Text
+        header = page.findChild(QObject, "partyTotalsHeader")
+        assert header is not None, "Header text not found"
+        assert "إجمالي أصوات الأحزاب" in header.property("text")
 
-        assert header_found, "Header text not found"
-
-    def test_columns_configuration(self, helper):
+    def test_columns_configuration(self, default_root):
         """Test that columns are configured correctly."""
-        root = helper.create_party_totals_page()
+        root = default_root
         page = root.property("page")
 
         # Get columns property
@@ -113,9 +117,9 @@ class TestPartyTotalsPage:
         assert "total_votes" in column_keys
         assert "percentage" in column_keys
 
-    def test_sorting_signal_emission(self, helper):
+    def test_sorting_signal_emission(self, helper, default_root):
         """Test that sorting signals are emitted correctly."""
-        root = helper.create_party_totals_page()
+        root = default_root
         page = root.property("page")
 
         # Find the results table
@@ -148,9 +152,9 @@ class TestPartyTotalsPage:
         is_loading = results_table.property("isLoading")
         assert is_loading is not None
 
-    def test_rtl_layout_support(self, helper):
+    def test_rtl_layout_support(self, helper, default_root):
         """Test that RTL layout is properly supported."""
-        root = helper.create_party_totals_page()
+        root = default_root
         page = root.property("page")
 
         # Page should have RTL mirroring enabled
@@ -160,26 +164,19 @@ class TestPartyTotalsPage:
         column_layouts = helper.find_children(page, "ColumnLayout")
         assert len(column_layouts) > 0, "ColumnLayout not found"
 
-    def test_theme_integration(self, helper):
+    def test_theme_integration(self, default_root):
         """Test that page uses Theme properties."""
-        root = helper.create_party_totals_page()
+        root = default_root
         page = root.property("page")
 
         # Page background should use Theme.backgroundColor
         page_color = page.property("color")
         assert page_color is not None
 
-        # Find text elements that should use theme colors
-        texts = helper.find_children(page, "Text")
-        theme_text_found = False
-
-        for text in texts:
-            color = text.property("color")
-            if color:  # Should have color set from Theme
-                theme_text_found = True
-                break
-
-        assert theme_text_found, "Theme colors not applied to text"
+        # Header text should have its color set from Theme
+        header = page.findChild(QObject, "partyTotalsHeader")
+        assert header is not None, "Header text not found"
+        assert header.property("color"), "Theme colors not applied to text"
 
     def test_empty_data_handling(self, helper):
         """Test page behavior with empty data."""
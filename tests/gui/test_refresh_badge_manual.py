@@ -1,5 +1,7 @@
 """Tests for RefreshBadge manual refresh functionality."""
 
+import gc
+
 import pytest
 
 from tests.helpers.qml_test_helper import QMLTestHelper
@@ -13,86 +15,28 @@ class RefreshBadgeTestHelper(QMLTestHelper):
         if last_update_time is None:
             last_update_time = "2024-01-01T12:00:00"
 
-        qml_code = f"""
-        import QtQuick 2.15
-        import QtQuick.Controls 2.15
-        import "../../../src/jcselect/ui/components/"
-
-        Item {{
-            id: root
-            width: 200
-            height: 100
-
-            property bool refreshCalled: false
-            property alias badge: refreshBadge
-
-            RefreshBadge {{
-                id: refreshBadge
-                anchors.centerIn: parent
-                
-                isSyncing: {str(is_syncing).lower()}
-                lastUpdateTime: new Date("{last_update_time}")
-                
-                onRefreshRequested: {{
-                    root.refreshCalled = true
-                }}
-            }}
-        }}
-        """
-        return self.create_qml_object(qml_code)
+        return self.create_qml_fixture(
+            "RefreshBadgeManualFixture.qml",
+            {"isSyncing": is_syncing, "lastUpdateIso": last_update_time},
+        )
 
     def create_refresh_badge_with_controller(self):
         """Create a RefreshBadge with mock controller integration."""
-        qml_code = """
-        import QtQuick 2.15
-        import QtQuick.Controls 2.15
-        import "../../../src/jcselect/ui/components/"
-
-        Item {
-            id: root
-            width: 200
-            height: 100
-
-            property bool refreshNowCalled: false
-            property bool refreshDataCalled: false
-            property alias badge: refreshBadge
-
-            property var mockController: {
-                "isSyncing": false,
-                "lastUpdated": new Date("2024-01-01T12:00:00"),
-                "refreshNow": function() {
-                    root.refreshNowCalled = true
-                },
-                "refreshData": function() {
-                    root.refreshDataCalled = true
-                }
-            }
-
-            RefreshBadge {
-                id: refreshBadge
-                anchors.centerIn: parent
-                
-                isSyncing: mockController.isSyncing
-                lastUpdateTime: mockController.lastUpdated
-                
-                onRefreshRequested: {
-                    if (mockController.refreshNow) {
-                        mockController.refreshNow()
-                    }
-                }
-            }
-        }
-        """
-        return self.create_qml_object(qml_code)
+        return self.create_qml_fixture("RefreshBadgeControllerFixture.qml")
 
 
 class TestRefreshBadgeManual:
     """Test suite for RefreshBadge manual refresh functionality."""
 
-    @pytest.fixture
-    def helper(self, qml_engine):
-        """Create test helper."""
-        return RefreshBadgeTestHelper(qml_engine)
+    @pytest.fixture(scope="class")
+    def helper(self, shared_qml_engine):
+        """Create one test helper on the session-wide QML engine per class."""
+        helper = RefreshBadgeTestHelper(shared_qml_engine)
+        yield helper
+
+        # Release the helper's references; the engine itself stays up
+        helper.clear_caches()
+        gc.collect()
 
     def test_refresh_badge_creation(self, helper):
         """Test that RefreshBadge can be created."""
@@ -111,7 +55,7 @@ class TestRefreshBadgeManual:
         assert root.property("refreshCalled") is False
 
         # Find and click refresh button
-        refresh_buttons = helper.find_children(badge, "Button")
+        refresh_buttons = helper.find_children_cached(badge, "Button")
         refresh_button = None
 
         for button in refresh_buttons:
@@ -123,15 +67,15 @@ class TestRefreshBadgeManual:
 
         if refresh_button:
             # Simulate button click
-            refresh_button.clicked.emit()
-            helper.process_events()
+            with helper.wait_for_signal(badge, "refreshRequested"):
+                refresh_button.clicked.emit()
 
             # Verify signal was emitted
             assert root.property("refreshCalled") is True
         else:
             # If no explicit button found, try triggering refresh directly
-            badge.refreshRequested.emit()
-            helper.process_events()
+            with helper.wait_for_signal(badge, "refreshRequested"):
+                badge.refreshRequested.emit()
             assert root.property("refreshCalled") is True
 
     def test_refresh_badge_with_controller_integration(self, helper):
@@ -212,9 +156,9 @@ class TestRefreshBadgeManual:
         # Badge should be accessible
         assert badge is not None
 
-        # Look for interactive elements
-        buttons = helper.find_children(badge, "Button")
-        mouse_areas = helper.find_children(badge, "MouseArea")
+        # Look for interactive elements (one walk of the badge serves both lookups)
+        buttons = helper.find_children_cached(badge, "Button")
+        mouse_areas = helper.find_children_cached(badge, "MouseArea")
 
         # Should have some interactive element for refresh
         assert len(buttons) > 0 or len(mouse_areas) > 0
@@ -229,7 +173,7 @@ class TestRefreshBadgeManual:
         assert badge is not None
 
         # Find text elements that should support RTL
-        texts = helper.find_children(badge, "Text")
+        texts = helper.find_children_cached(badge, "Text")
         for text in texts:
             # Text elements should exist and be properly configured
             assert text is not None
@@ -1,82 +1,82 @@
 """Tests for ResultsTable QML component."""
 
+import gc
+
 import pytest
+from PySide6.QtCore import QObject
 
 from tests.helpers.qml_test_helper import QMLTestHelper
 
+# Column titles of the ResultsTable fixture
+_HEADER_LABELS = frozenset(("الاسم", "الأصوات", "النسبة"))
+
 
 class ResultsTableTestHelper(QMLTestHelper):
     """Helper class for testing ResultsTable component."""
 
-    def create_results_table(self, is_loading=False, sortable=True):
-        """Create a ResultsTable instance for testing."""
-        qml_code = f"""
-        import QtQuick 2.15
-        import jcselect.ui.components 1.0
-
-        ResultsTable {{
-            id: resultsTable
-            width: 600
-            height: 400
-            isLoading: {str(is_loading).lower()}
-            sortable: {str(sortable).lower()}
-
-            property string lastSortColumn: ""
-            property bool lastSortDescending: false
-
-            columns: [
-                {{
-                    "key": "name",
-                    "title": "الاسم",
-                    "type": "text",
-                    "align": "right",
-                    "width": 200,
-                    "sortable": true
-                }},
-                {{
-                    "key": "votes",
-                    "title": "الأصوات",
-                    "type": "number",
-                    "align": "center",
-                    "width": 120,
-                    "sortable": true
-                }},
-                {{
-                    "key": "percentage",
-                    "title": "النسبة",
-                    "type": "percentage",
-                    "align": "center",
-                    "width": 100,
-                    "sortable": false
-                }}
-            ]
-
-            model: [
-                {{"name": "أحمد محمد", "votes": 150, "percentage": 35.5}},
-                {{"name": "فاطمة علي", "votes": 200, "percentage": 47.2}},
-                {{"name": "محمود حسن", "votes": 73, "percentage": 17.3}}
-            ]
-
-            onSortRequested: function(columnKey, descending) {{
-                lastSortColumn = columnKey
-                lastSortDescending = descending
-            }}
-        }}
+    def __init__(self, qml_engine):
+        """Initialize with QML engine."""
+        super().__init__(qml_engine)
+        # id(table) -> (table, {header label: header button})
+        self._header_indexes = {}
+
+    def create_results_table(self, is_loading=False, sortable=True, **overrides):
+        """Create a ResultsTable instance for testing.
+
+        overrides replace other fixture properties (e.g. model=[]) so every
+        variant is created from the one compiled fixture component.
         """
-        return self.create_qml_object(qml_code)
+        return self.create_qml_fixture(
+            "ResultsTableFixture.qml",
+            {"isLoading": is_loading, "sortable": sortable, **overrides},
+        )
+
+    def header_index(self, results_table):
+        """Map each header label to its header button, building the map once per table."""
+        cached = self._header_indexes.get(id(results_table))
+        if cached is not None and cached[0] is results_table:
+            return cached[1]
+
+        index = {}
+        for button in self.find_children_cached(results_table, "Button"):
+            for text in self.find_children_cached(button, "Text"):
+                # First button wins, as in a top-down search
+                index.setdefault(text.property("text"), button)
+        self._header_indexes[id(results_table)] = (results_table, index)
+        return index
+
+    def clear_caches(self):
+        """Drop cached header indexes along with the base caches."""
+        super().clear_caches()
+        self._header_indexes.clear()
 
 
 class TestResultsTable:
     """Test suite for ResultsTable component."""
 
+    @pytest.fixture(scope="class")
+    def helper(self, shared_qml_engine):
+        """Create one test helper on the session-wide QML engine per class."""
+        helper = ResultsTableTestHelper(shared_qml_engine)
+        yield helper
+
+        # Release the helper's references; the engine itself stays up
+        helper.clear_caches()
+        gc.collect()
+
+    @pytest.fixture(scope="class")
+    def shared_table(self, helper):
+        """Create one default table shared by the tests that only read it."""
+        return helper.create_results_table()
+
     @pytest.fixture
-    def helper(self, qml_engine):
-        """Create test helper."""
-        return ResultsTableTestHelper(qml_engine)
+    def fresh_table(self, helper):
+        """Create a default table for a test that changes its sort state."""
+        return helper.create_results_table()
 
-    def test_results_table_creation(self, helper):
+    def test_results_table_creation(self, shared_table):
         """Test that ResultsTable can be created."""
-        results_table = helper.create_results_table()
+        results_table = shared_table
         assert results_table is not None
 
         # Check initial properties
@@ -85,56 +85,33 @@ class TestResultsTable:
         assert results_table.property("lastSortColumn") == ""
         assert results_table.property("lastSortDescending") is False
 
-    def test_table_model_population(self, helper):
+    def test_table_model_population(self, helper, shared_table):
         """Test that table populates with model data."""
-        results_table = helper.create_results_table()
+        results_table = shared_table
 
         # Find the ListView (table content)
-        list_view = helper.find_child(results_table, "ListView")
+        list_view = helper.find_child_cached(results_table, "ListView")
         assert list_view is not None
 
         # Should have 3 items from the model
         assert list_view.property("count") == 3
 
-    def test_column_headers_display(self, helper):
+    def test_column_headers_display(self, helper, shared_table):
         """Test that column headers are displayed correctly."""
-        results_table = helper.create_results_table()
+        results_table = shared_table
 
-        # Find header buttons
-        header_buttons = helper.find_children(results_table, "Button")
+        # Should have a header button for each column
+        missing = _HEADER_LABELS - helper.header_index(results_table).keys()
+        assert not missing, f"Missing column headers: {sorted(missing)}"
 
-        # Should have header buttons for each column
-        header_texts = []
-        for button in header_buttons:
-            texts = helper.find_children(button, "Text")
-            for text in texts:
-                text_content = text.property("text")
-                if text_content in ["الاسم", "الأصوات", "النسبة"]:
-                    header_texts.append(text_content)
-
-        assert "الاسم" in header_texts
-        assert "الأصوات" in header_texts
-        assert "النسبة" in header_texts
-
-    def test_header_sorting_click(self, helper):
+    def test_header_sorting_click(self, helper, fresh_table):
         """Test clicking header triggers sorting."""
-        results_table = helper.create_results_table()
-
-        # Find a sortable header button (name column)
-        header_buttons = helper.find_children(results_table, "Button")
-        name_header = None
-
-        for button in header_buttons:
-            if button.property("enabled"):  # Sortable headers are enabled
-                texts = helper.find_children(button, "Text")
-                for text in texts:
-                    if text.property("text") == "الاسم":
-                        name_header = button
-                        break
-            if name_header:
-                break
+        results_table = fresh_table
 
+        # Find a sortable header button (name column); sortable headers are enabled
+        name_header = helper.header_index(results_table).get("الاسم")
         assert name_header is not None, "Name header button not found"
+        assert name_header.property("enabled")
 
         # Click the header
         helper.click_item(name_header)
@@ -144,25 +121,14 @@ class TestResultsTable:
         assert results_table.property("lastSortColumn") == "name"
         assert results_table.property("lastSortDescending") is True  # First click is descending
 
-    def test_sorting_toggle_behavior(self, helper):
+    def test_sorting_toggle_behavior(self, helper, fresh_table):
         """Test that clicking same header toggles sort order."""
-        results_table = helper.create_results_table()
+        results_table = fresh_table
 
         # Find votes header (another sortable column)
-        header_buttons = helper.find_children(results_table, "Button")
-        votes_header = None
-
-        for button in header_buttons:
-            if button.property("enabled"):
-                texts = helper.find_children(button, "Text")
-                for text in texts:
-                    if text.property("text") == "الأصوات":
-                        votes_header = button
-                        break
-            if votes_header:
-                break
-
+        votes_header = helper.header_index(results_table).get("الأصوات")
         assert votes_header is not None, "Votes header button not found"
+        assert votes_header.property("enabled")
 
         # First click - should be descending
         helper.click_item(votes_header)
@@ -178,158 +144,75 @@ class TestResultsTable:
         assert results_table.property("lastSortColumn") == "votes"
         assert results_table.property("lastSortDescending") is False
 
-    def test_non_sortable_column_header(self, helper):
+    def test_non_sortable_column_header(self, helper, shared_table):
         """Test non-sortable column headers are disabled."""
-        results_table = helper.create_results_table()
+        results_table = shared_table
 
         # Find percentage header (non-sortable in our test data)
-        header_buttons = helper.find_children(results_table, "Button")
-        percentage_header = None
-
-        for button in header_buttons:
-            texts = helper.find_children(button, "Text")
-            for text in texts:
-                if text.property("text") == "النسبة":
-                    percentage_header = button
-                    break
-            if percentage_header:
-                break
-
+        percentage_header = helper.header_index(results_table).get("النسبة")
         assert percentage_header is not None, "Percentage header button not found"
 
         # Non-sortable header should be disabled
         assert percentage_header.property("enabled") is False
 
-    def test_sort_indicator_display(self, helper):
+    def test_sort_indicator_display(self, helper, fresh_table):
         """Test sort indicators show correctly."""
-        results_table = helper.create_results_table()
+        results_table = fresh_table
 
         # Set current sort column
-        results_table.setProperty("currentSortColumn", "votes")
-        results_table.setProperty("sortDescending", True)
-        helper.process_events()
-
-        # Find the votes header
-        header_buttons = helper.find_children(results_table, "Button")
-        votes_header = None
-
-        for button in header_buttons:
-            texts = helper.find_children(button, "Text")
-            for text in texts:
-                if text.property("text") == "الأصوات":
-                    votes_header = button
-                    break
-            if votes_header:
-                break
+        helper.set_properties_batch(results_table, currentSortColumn="votes", sortDescending=True)
 
-        # Should have sort indicator
-        if votes_header:
-            sort_indicators = helper.find_children(votes_header, "Text")
-            indicator_found = False
-            for indicator in sort_indicators:
-                text_content = indicator.property("text")
-                if text_content in ["↓", "↑"]:
-                    indicator_found = True
-                    # Should show downward arrow for descending
-                    assert text_content == "↓"
-                    break
-            assert indicator_found, "Sort indicator not found"
+        # Should have sort indicator, showing a downward arrow for descending.
+        # It sits in the header Repeater's delegate, which has a visual parent
+        # but no QObject parent, so walk the item tree rather than findChild.
+        indicator = helper.find_child_by_property(results_table, "objectName", "sortIndicator_votes")
+        assert indicator is not None, "Sort indicator not found"
+        assert indicator.property("text") == "↓"
 
     def test_loading_overlay_display(self, helper):
         """Test loading overlay is shown when isLoading is true."""
         # Test normal state (no loading)
         results_table_normal = helper.create_results_table(is_loading=False)
-        normal_overlays = helper.find_children(results_table_normal, "Rectangle")
-
-        loading_overlay_visible = False
-        for overlay in normal_overlays:
-            if overlay.property("visible") and "Loading" in str(overlay):
-                loading_overlay_visible = True
-                break
+        normal_overlay = results_table_normal.findChild(QObject, "loadingOverlay")
+        assert normal_overlay is not None, "Loading overlay not found"
 
         # Should not have visible loading overlay
-        assert not loading_overlay_visible
+        assert normal_overlay.property("visible") is False
 
         # Test loading state
         results_table_loading = helper.create_results_table(is_loading=True)
-        loading_overlays = helper.find_children(results_table_loading, "Rectangle")
-
-        loading_found = False
-        for overlay in loading_overlays:
-            if overlay.property("visible"):
-                # Check for BusyIndicator or loading text
-                busy_indicators = helper.find_children(overlay, "BusyIndicator")
-                loading_texts = helper.find_children(overlay, "Text")
-
-                for indicator in busy_indicators:
-                    if indicator.property("running"):
-                        loading_found = True
-                        break
-
-                if not loading_found:
-                    for text in loading_texts:
-                        if "جاري تحميل" in text.property("text"):
-                            loading_found = True
-                            break
-
-            if loading_found:
-                break
+        loading_overlay = results_table_loading.findChild(QObject, "loadingOverlay")
+        busy_indicator = results_table_loading.findChild(QObject, "loadingBusy")
 
-        assert loading_found, "Loading overlay not found when isLoading is true"
+        assert loading_overlay is not None, "Loading overlay not found"
+        assert loading_overlay.property("visible"), "Loading overlay hidden when isLoading is true"
+        assert busy_indicator is not None and busy_indicator.property("running")
 
     def test_empty_state_display(self, helper):
         """Test empty state is shown when no data."""
-        qml_code = """
-        import QtQuick 2.15
-        import jcselect.ui.components 1.0
-
-        ResultsTable {
-            id: resultsTable
-            width: 600
-            height: 400
-            isLoading: false
-
-            columns: [
-                {
-                    "key": "name",
-                    "title": "الاسم",
-                    "type": "text",
-                    "width": 200
-                }
-            ]
-
-            model: []  // Empty model
-        }
-        """
-
-        empty_table = helper.create_qml_object(qml_code)
+        empty_table = helper.create_results_table(model=[])  # Empty model
         assert empty_table is not None
 
         # Find the ListView
-        list_view = helper.find_child(empty_table, "ListView")
+        list_view = helper.find_child_cached(empty_table, "ListView")
         assert list_view is not None
         assert list_view.property("count") == 0
 
         # Should show empty state
-        empty_state_texts = helper.find_children(empty_table, "Text")
-        empty_message_found = False
-
-        for text in empty_state_texts:
-            if "لا توجد بيانات للعرض" in text.property("text"):
-                empty_message_found = True
-                break
-
-        assert empty_message_found, "Empty state message not found"
+        empty_label = empty_table.findChild(QObject, "emptyStateLabel")
+        assert empty_label is not None, "Empty state message not found"
+        assert empty_label.property("visible")
+        assert "لا توجد بيانات للعرض" in empty_label.property("text")
 
-    def test_rtl_layout_mirroring(self, helper):
+    def test_rtl_layout_mirroring(self, helper, shared_table):
         """Test RTL layout mirroring is applied."""
-        results_table = helper.create_results_table()
+        results_table = shared_table
 
         # Root table should have LayoutMirroring enabled
         # Note: This might be hard to test directly, but we can check structure
 
         # Find text elements and check they have RTL support
-        text_elements = helper.find_children(results_table, "Text")
+        text_elements = helper.find_children_cached(results_table, "Text")
         rtl_support_found = False
 
         for text in text_elements:
@@ -341,12 +224,12 @@ class TestResultsTable:
 
         assert rtl_support_found, "Text elements not found for RTL testing"
 
-    def test_data_formatting(self, helper):
+    def test_data_formatting(self, helper, shared_table):
         """Test data is formatted correctly by column type."""
-        results_table = helper.create_results_table()
+        results_table = shared_table
 
         # Find the table rows/cells
-        list_view = helper.find_child(results_table, "ListView")
+        list_view = helper.find_child_cached(results_table, "ListView")
         assert list_view is not None
 
         # The data formatting is handled in the delegate
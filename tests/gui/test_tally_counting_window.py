@@ -1,23 +1,25 @@
 """GUI tests for TallyCountingWindow and related components."""
 import pytest
-import os
+from pathlib import Path
 from unittest.mock import Mock, patch
 
+from tests.helpers.text_scan import assert_contains_all
+
+_UI_DIR = Path("src/jcselect/ui")
+_TALLY_WINDOW = _UI_DIR / "TallyCountingWindow.qml"
+_DASHBOARD_CONTROLLER = "src/jcselect/controllers/dashboard_controller.py"
+
 
 class TestTallyCountingWindowComponents:
     """Test TallyCountingWindow GUI components."""
 
     def test_tally_counting_window_exists(self):
         """Test that TallyCountingWindow.qml file exists."""
-        window_path = os.path.join("src", "jcselect", "ui", "TallyCountingWindow.qml")
-        assert os.path.exists(window_path)
+        assert _TALLY_WINDOW.exists()
 
-    def test_tally_counting_window_imports(self):
+    def test_tally_counting_window_imports(self, qml_sources):
         """Test that TallyCountingWindow has correct imports and structure."""
-        window_path = os.path.join("src", "jcselect", "ui", "TallyCountingWindow.qml")
-        
-        with open(window_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = qml_sources["TallyCountingWindow.qml"]
         
         # Verify imports
         assert "import QtQuick" in content
@@ -30,49 +32,42 @@ class TestTallyCountingWindowComponents:
         assert "TallyController" in content
         assert "id: tallyController" in content
 
-    def test_tally_counting_window_component_usage(self):
+    def test_tally_counting_window_component_usage(self, qml_sources):
         """Test that TallyCountingWindow uses the required components."""
-        window_path = os.path.join("src", "jcselect", "ui", "TallyCountingWindow.qml")
-        
-        with open(window_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Verify component usage
-        assert "PartyColumn" in content
-        assert "BallotTypePanel" in content
-        assert "ValidationWarnings" in content
-        assert "TallyTotals" in content
-        
-        # Verify data binding
-        assert "partyData: modelData" in content
-        assert "selectedCandidate: tallyController.selectedCandidates" in content
-        assert "selectedType: tallyController.selectedBallotType" in content
-        assert "warnings: tallyController.validationMessages" in content
-
-    def test_tally_counting_window_signal_connections(self):
+        content = qml_sources["TallyCountingWindow.qml"]
+        
+        assert_contains_all(content, (
+            # Component usage
+            "PartyColumn",
+            "BallotTypePanel",
+            "ValidationWarnings",
+            "TallyTotals",
+            # Data binding
+            "partyData: modelData",
+            "selectedCandidate: tallyController.selectedCandidates",
+            "selectedType: tallyController.selectedBallotType",
+            "warnings: tallyController.validationMessages",
+        ))
+
+    def test_tally_counting_window_signal_connections(self, qml_sources):
         """Test that TallyCountingWindow connects component signals properly."""
-        window_path = os.path.join("src", "jcselect", "ui", "TallyCountingWindow.qml")
-        
-        with open(window_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Verify signal connections
-        assert "onCandidateSelected:" in content
-        assert "onTypeSelected:" in content
-        assert "tallyController.selectCandidate" in content
-        assert "tallyController.selectBallotType" in content
-        
-        # Verify controller signal handling
-        assert "onBallotConfirmed:" in content
-        assert "onRecountCompleted:" in content
-        assert "onErrorOccurred:" in content
-
-    def test_tally_counting_window_rtl_layout(self):
+        content = qml_sources["TallyCountingWindow.qml"]
+        
+        assert_contains_all(content, (
+            # Signal connections
+            "onCandidateSelected:",
+            "onTypeSelected:",
+            "tallyController.selectCandidate",
+            "tallyController.selectBallotType",
+            # Controller signal handling
+            "onBallotConfirmed:",
+            "onRecountCompleted:",
+            "onErrorOccurred:",
+        ))
+
+    def test_tally_counting_window_rtl_layout(self, qml_sources):
         """Test that TallyCountingWindow supports RTL layout."""
-        window_path = os.path.join("src", "jcselect", "ui", "TallyCountingWindow.qml")
-        
-        with open(window_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = qml_sources["TallyCountingWindow.qml"]
         
         # Check for RTL-friendly alignment
         assert "Text.AlignRight" in content
@@ -83,12 +78,9 @@ class TestTallyCountingWindowComponents:
         assert "ورقة رقم" in content or "Ballot #" in content
         assert "إعادة العد" in content or "Start Recount" in content
 
-    def test_tally_counting_window_action_buttons(self):
+    def test_tally_counting_window_action_buttons(self, qml_sources):
         """Test that TallyCountingWindow has proper action buttons."""
-        window_path = os.path.join("src", "jcselect", "ui", "TallyCountingWindow.qml")
-        
-        with open(window_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = qml_sources["TallyCountingWindow.qml"]
         
         # Verify action buttons
         assert "tallyController.clearCurrentBallot" in content
@@ -99,96 +91,87 @@ class TestTallyCountingWindowComponents:
         assert "إلغاء" in content or "Cancel" in content
         assert "تأكيد الورقة" in content or "Confirm Ballot" in content
 
-    def test_tally_counting_window_totals_binding(self):
+    def test_tally_counting_window_totals_binding(self, qml_sources):
         """Test that TallyCountingWindow binds totals correctly."""
-        window_path = os.path.join("src", "jcselect", "ui", "TallyCountingWindow.qml")
-        
-        with open(window_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = qml_sources["TallyCountingWindow.qml"]
         
         # Verify totals binding
-        assert "totalVotes: tallyController.totalVotes" in content
-        assert "totalCounted: tallyController.totalCounted" in content
-        assert "totalCandidates: tallyController.totalCandidates" in content
-        assert "totalWhite: tallyController.totalWhite" in content
-        assert "totalIllegal: tallyController.totalIllegal" in content
-        assert "totalCancel: tallyController.totalCancel" in content
-        assert "totalBlank: tallyController.totalBlank" in content
-
-    def test_new_components_structure(self):
-        """Test that new components have correct structure."""
-        components_dir = os.path.join("src", "jcselect", "ui", "components")
-        
-        # Test TallyTotals component
-        totals_path = os.path.join(components_dir, "TallyTotals.qml")
-        with open(totals_path, 'r', encoding='utf-8') as f:
-            totals_content = f.read()
-        
-        assert "property int totalVotes" in totals_content
-        assert "property int totalCandidates" in totals_content
-        assert "property int totalWhite" in totals_content
-        assert "property int totalIllegal" in totals_content
+        assert_contains_all(content, (
+            "totalVotes: tallyController.totalVotes",
+            "totalCounted: tallyController.totalCounted",
+            "totalCandidates: tallyController.totalCandidates",
+            "totalWhite: tallyController.totalWhite",
+            "totalIllegal: tallyController.totalIllegal",
+            "totalCancel: tallyController.totalCancel",
+            "totalBlank: tallyController.totalBlank",
+        ))
+
+    def test_tally_totals_structure(self, qml_sources):
+        """Test that TallyTotals exposes the vote totals."""
+        totals_content = qml_sources["components/TallyTotals.qml"]
+        
+        assert_contains_all(totals_content, (
+            "property int totalVotes",
+            "property int totalCandidates",
+            "property int totalWhite",
+            "property int totalIllegal",
+        ))
         assert "إجمالي الأصوات" in totals_content or "Vote Totals" in totals_content
+
+    def test_validation_warnings_structure(self, qml_sources):
+        """Test that ValidationWarnings shows only when there are warnings."""
+        warnings_content = qml_sources["components/ValidationWarnings.qml"]
         
-        # Test ValidationWarnings component
-        warnings_path = os.path.join(components_dir, "ValidationWarnings.qml")
-        with open(warnings_path, 'r', encoding='utf-8') as f:
-            warnings_content = f.read()
-        
-        assert "property var warnings" in warnings_content
-        assert "visible: warnings.length > 0" in warnings_content
+        assert_contains_all(warnings_content, (
+            "property var warnings",
+            "visible: warnings.length > 0",
+        ))
         assert "تحذيرات التصويت" in warnings_content or "Voting Warnings" in warnings_content
 
-    def test_component_registrations(self):
+    def test_component_registrations(self, qml_sources):
         """Test that all components are properly registered in qmldir."""
-        qmldir_path = os.path.join("src", "jcselect", "ui", "components", "qmldir")
-        
-        with open(qmldir_path, 'r', encoding='utf-8') as f:
-            qmldir_content = f.read()
+        qmldir_content = qml_sources["components/qmldir"]
         
         # Verify all components are registered
-        assert "PartyColumn 1.0 PartyColumn.qml" in qmldir_content
-        assert "CandidateCheckbox 1.0 CandidateCheckbox.qml" in qmldir_content
-        assert "BallotTypePanel 1.0 BallotTypePanel.qml" in qmldir_content
-        assert "TallyTotals 1.0 TallyTotals.qml" in qmldir_content
-        assert "ValidationWarnings 1.0 ValidationWarnings.qml" in qmldir_content
-
-    def test_material_3_design_consistency(self):
-        """Test that components follow Material 3 design patterns."""
-        components_dir = os.path.join("src", "jcselect", "ui", "components")
-        
-        # Test consistency across components
-        for component_file in ["PartyColumn.qml", "CandidateCheckbox.qml", "BallotTypePanel.qml", 
-                              "TallyTotals.qml", "ValidationWarnings.qml"]:
-            component_path = os.path.join(components_dir, component_file)
-            
-            with open(component_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check for Material 3 design elements
-            assert "radius:" in content  # Rounded corners
-            assert "color:" in content   # Color theming
-            
-            # Check for consistent layout patterns
-            if component_file in ["PartyColumn.qml", "BallotTypePanel.qml", "TallyTotals.qml"]:
-                assert "Layout.fillWidth" in content or "anchors.fill" in content
-
-    def test_accessibility_features(self):
+        assert_contains_all(qmldir_content, (
+            "PartyColumn 1.0 PartyColumn.qml",
+            "CandidateCheckbox 1.0 CandidateCheckbox.qml",
+            "BallotTypePanel 1.0 BallotTypePanel.qml",
+            "TallyTotals 1.0 TallyTotals.qml",
+            "ValidationWarnings 1.0 ValidationWarnings.qml",
+        ))
+
+    @pytest.mark.parametrize("component_file,needs_layout_fill", [
+        ("PartyColumn.qml", True),
+        ("CandidateCheckbox.qml", False),
+        ("BallotTypePanel.qml", True),
+        ("TallyTotals.qml", True),
+        ("ValidationWarnings.qml", False),
+    ])
+    def test_material_3_design_consistency(
+        self, qml_component_index, component_file, needs_layout_fill
+    ):
+        """Test that each component follows Material 3 design patterns."""
+        flags = qml_component_index[component_file]
+        
+        # Check for Material 3 design elements
+        assert flags["has_radius"], f"{component_file} has no rounded corners"
+        assert flags["has_color"], f"{component_file} has no color theming"
+        
+        # Check for consistent layout patterns
+        if needs_layout_fill:
+            assert flags["has_layout_fill"], f"{component_file} does not fill its layout"
+
+    def test_accessibility_features(self, qml_sources):
         """Test that components include accessibility features."""
-        components_dir = os.path.join("src", "jcselect", "ui", "components")
-        
         # Test CandidateCheckbox for keyboard navigation
-        checkbox_path = os.path.join(components_dir, "CandidateCheckbox.qml")
-        with open(checkbox_path, 'r', encoding='utf-8') as f:
-            checkbox_content = f.read()
+        checkbox_content = qml_sources["components/CandidateCheckbox.qml"]
         
         assert "MouseArea" in checkbox_content
         assert "Qt.PointingHandCursor" in checkbox_content
         
         # Test ValidationWarnings for proper text rendering
-        warnings_path = os.path.join(components_dir, "ValidationWarnings.qml")
-        with open(warnings_path, 'r', encoding='utf-8') as f:
-            warnings_content = f.read()
+        warnings_content = qml_sources["components/ValidationWarnings.qml"]
         
         assert "wrapMode: Text.WordWrap" in warnings_content
 
@@ -196,12 +179,9 @@ class TestTallyCountingWindowComponents:
 class TestTallyCountingWindowIntegration:
     """Test TallyCountingWindow integration with App.qml."""
 
-    def test_app_navigation_integration(self):
+    def test_app_navigation_integration(self, qml_sources):
         """Test that App.qml properly integrates TallyCountingWindow."""
-        app_path = os.path.join("src", "jcselect", "ui", "App.qml")
-        
-        with open(app_path, 'r', encoding='utf-8') as f:
-            app_content = f.read()
+        app_content = qml_sources["App.qml"]
         
         # Verify tally counting case in switch statement
         assert 'case "tally_counting":' in app_content
@@ -211,23 +191,17 @@ class TestTallyCountingWindowIntegration:
         assert "id: tallyCountingComponent" in app_content
         assert "TallyCountingWindow" in app_content
 
-    def test_dashboard_controller_integration(self):
+    def test_dashboard_controller_integration(self, mapped_source):
         """Test that dashboard controller has openTallyCounting method."""
-        controller_path = os.path.join("src", "jcselect", "controllers", "dashboard_controller.py")
-        
-        with open(controller_path, 'r', encoding='utf-8') as f:
-            controller_content = f.read()
+        controller_content = mapped_source(_DASHBOARD_CONTROLLER)
         
         # Verify openTallyCounting method exists
-        assert "def openTallyCounting(self)" in controller_content
-        assert 'self.navigationRequested.emit("tally_counting")' in controller_content
+        assert b"def openTallyCounting(self)" in controller_content
+        assert b'self.navigationRequested.emit("tally_counting")' in controller_content
 
-    def test_session_initialization(self):
+    def test_session_initialization(self, qml_sources):
         """Test that TallyCountingWindow initializes sessions properly."""
-        window_path = os.path.join("src", "jcselect", "ui", "TallyCountingWindow.qml")
-        
-        with open(window_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = qml_sources["TallyCountingWindow.qml"]
         
         # Should not have automatic initialization since that's handled by App.qml now
         assert "Component.onCompleted" in content
@@ -1,58 +1,74 @@
 """Tests for WinnersPage QML component."""
 
+import gc
+
 import pytest
 
 from tests.helpers.qml_test_helper import QMLTestHelper
 
+# Builds pages on the session QML engine; share a worker with the other
+# Qt-driving tests under --dist loadgroup
+pytestmark = pytest.mark.xdist_group("qt")
+
+
+# Static page source; the data comes from per-object context properties
+_WINNERS_QML = """
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import "../../../src/jcselect/ui/pages/"
+
+Item {
+    id: root
+    width: 1000
+    height: 700
+
+    property var mockController: ({ "winners": mockWinners, "isSyncing": mockLoading })
+
+    property alias page: winnersPage
+
+    WinnersPage {
+        id: winnersPage
+        anchors.fill: parent
+
+        // Mock results controller
+        property var resultsController: root.mockController
+    }
+}
+"""
+
+DEFAULT_WINNERS = [
+    {"candidate_name": "أحمد محمود", "party_name": "حزب الحرية", "total_votes": 1250, "rank": 1, "is_elected": True},
+    {"candidate_name": "فاطمة حسن", "party_name": "حزب التقدم", "total_votes": 1180, "rank": 2, "is_elected": True},
+    {"candidate_name": "محمد علي", "party_name": "حزب الوحدة", "total_votes": 950, "rank": 3, "is_elected": True}
+]
+
 
 class WinnersPageTestHelper(QMLTestHelper):
     """Helper class for testing WinnersPage component."""
 
     def create_winners_page(self, mock_data=None, is_loading=False):
         """Create a WinnersPage instance for testing."""
-        if mock_data is None:
-            mock_data = [
-                {"candidate_name": "أحمد محمود", "party_name": "حزب الحرية", "total_votes": 1250, "rank": 1, "is_elected": True},
-                {"candidate_name": "فاطمة حسن", "party_name": "حزب التقدم", "total_votes": 1180, "rank": 2, "is_elected": True},
-                {"candidate_name": "محمد علي", "party_name": "حزب الوحدة", "total_votes": 950, "rank": 3, "is_elected": True}
-            ]
-
-        qml_code = f"""
-        import QtQuick 2.15
-        import QtQuick.Controls 2.15
-        import "../../../src/jcselect/ui/pages/"
-
-        Item {{
-            id: root
-            width: 1000
-            height: 700
-
-            property var mockController: {{
-                "winners": {str(mock_data).replace("'", '"')},
-                "isSyncing": {str(is_loading).lower()}
-            }}
-
-            property alias page: winnersPage
-
-            WinnersPage {{
-                id: winnersPage
-                anchors.fill: parent
-
-                // Mock results controller
-                property var resultsController: root.mockController
-            }}
-        }}
-        """
-        return self.create_qml_object(qml_code)
+        return self.create_qml_object(
+            _WINNERS_QML,
+            context_properties={
+                "mockWinners": DEFAULT_WINNERS if mock_data is None else mock_data,
+                "mockLoading": is_loading,
+            },
+        )
 
 
 class TestWinnersPage:
     """Test suite for WinnersPage component."""
 
-    @pytest.fixture
-    def helper(self, qml_engine):
-        """Create test helper."""
-        return WinnersPageTestHelper(qml_engine)
+    @pytest.fixture(scope="class")
+    def helper(self, shared_qml_engine):
+        """Create one test helper on the session-wide QML engine per class."""
+        helper = WinnersPageTestHelper(shared_qml_engine)
+        yield helper
+
+        # Release the helper's references; the engine itself stays up
+        helper.clear_caches()
+        gc.collect()
 
     def test_winners_page_creation(self, helper):
         """Test that WinnersPage can be created."""
@@ -74,7 +90,7 @@ class TestWinnersPage:
         page = root.property("page")
 
         # Find winner cards
-        winner_cards = helper.find_children(page, "WinnerCard")
+        winner_cards = helper.find_children_cached(page, "WinnerCard")
         assert len(winner_cards) == 2, f"Expected 2 winner cards, found {len(winner_cards)}"
 
     def test_winner_cards_order_by_rank(self, helper):
@@ -89,7 +105,7 @@ class TestWinnersPage:
         page = root.property("page")
 
         # Find winner cards
-        winner_cards = helper.find_children(page, "WinnerCard")
+        winner_cards = helper.find_children_cached(page, "WinnerCard")
         assert len(winner_cards) == 3
 
         # Verify ranks are in correct order (should be ascending: 1, 2, 3)
@@ -110,16 +126,8 @@ class TestWinnersPage:
         page = root.property("page")
 
         # Find header text
-        texts = helper.find_children(page, "Text")
-        header_found = False
-
-        for text in texts:
-            text_content = text.property("text")
-            if text_content and "الفائزون" in text_content:
-                header_found = True
-                break
-
-        assert header_found, "Header text not found"
+        texts = helper.find_children_cached(page, "Text")
+        assert any("الفائزون" in (text.property("text") or "") for text in texts), "Header text not found"
 
     def test_grid_layout_structure(self, helper):
         """Test that winners are displayed in a grid layout."""
@@ -127,11 +135,11 @@ class TestWinnersPage:
         page = root.property("page")
 
         # Find the grid layout
-        grid_layouts = helper.find_children(page, "GridLayout")
+        grid_layouts = helper.find_children_cached(page, "GridLayout")
         assert len(grid_layouts) > 0, "GridLayout not found"
 
         # Find scroll view for large lists
-        scroll_views = helper.find_children(page, "ScrollView")
+        scroll_views = helper.find_children_cached(page, "ScrollView")
         assert len(scroll_views) > 0, "ScrollView not found"
 
     def test_empty_state_display(self, helper):
@@ -141,16 +149,8 @@ class TestWinnersPage:
         page = root.property("page")
 
         # Should show empty state message
-        texts = helper.find_children(page, "Text")
-        empty_message_found = False
-
-        for text in texts:
-            text_content = text.property("text")
-            if text_content and "لم يتم تحديد الفائزين بعد" in text_content:
-                empty_message_found = True
-                break
-
-        assert empty_message_found, "Empty state message not found"
+        texts = helper.find_children_cached(page, "Text")
+        assert any("لم يتم تحديد الفائزين بعد" in (text.property("text") or "") for text in texts), "Empty state message not found"
 
     def test_loading_state_display(self, helper):
         """Test loading state when data is being calculated."""
@@ -158,27 +158,13 @@ class TestWinnersPage:
         page = root.property("page")
 
         # Should show loading indicator
-        busy_indicators = helper.find_children(page, "BusyIndicator")
-        loading_found = False
-
-        for indicator in busy_indicators:
-            if indicator.property("running"):
-                loading_found = True
-                break
-
-        assert loading_found, "Loading indicator not found"
+        busy_indicators = helper.find_children_cached(page, "BusyIndicator")
+        assert any(indicator.property("running") for indicator in busy_indicators), \
+            "Loading indicator not found"
 
         # Should show loading text
-        texts = helper.find_children(page, "Text")
-        loading_text_found = False
-
-        for text in texts:
-            text_content = text.property("text")
-            if text_content and "جاري حساب النتائج" in text_content:
-                loading_text_found = True
-                break
-
-        assert loading_text_found, "Loading text not found"
+        texts = helper.find_children_cached(page, "Text")
+        assert any("جاري حساب النتائج" in (text.property("text") or "") for text in texts), "Loading text not found"
 
     def test_winner_card_data_binding(self, helper):
         """Test that winner card data is properly bound."""
@@ -190,7 +176,7 @@ class TestWinnersPage:
         page = root.property("page")
 
         # Find the winner card
-        winner_cards = helper.find_children(page, "WinnerCard")
+        winner_cards = helper.find_children_cached(page, "WinnerCard")
         assert len(winner_cards) >= 1
 
         card = winner_cards[0]
@@ -214,7 +200,7 @@ class TestWinnersPage:
         page = root.property("page")
 
         # Find the grid layout with animation properties
-        grid_layouts = helper.find_children(page, "GridLayout")
+        grid_layouts = helper.find_children_cached(page, "GridLayout")
         assert len(grid_layouts) > 0
 
         grid = grid_layouts[0]
@@ -230,7 +216,7 @@ class TestWinnersPage:
 
         # Page should have RTL mirroring enabled
         # Find the main column layout
-        column_layouts = helper.find_children(page, "ColumnLayout")
+        column_layouts = helper.find_children_cached(page, "ColumnLayout")
         assert len(column_layouts) > 0, "ColumnLayout not found"
 
     def test_responsive_grid_columns(self, helper):
@@ -239,7 +225,7 @@ class TestWinnersPage:
         page = root.property("page")
 
         # Find the grid layout
-        grid_layouts = helper.find_children(page, "GridLayout")
+        grid_layouts = helper.find_children_cached(page, "GridLayout")
         assert len(grid_layouts) > 0
 
         grid = grid_layouts[0]
@@ -261,24 +247,11 @@ class TestWinnersPage:
         page = root.property("page")
 
         # Find winner cards
-        winner_cards = helper.find_children(page, "WinnerCard")
+        winner_cards = helper.find_children_cached(page, "WinnerCard")
         assert len(winner_cards) == 3
 
         # Each card should have the correct rank for badge styling
         # (Actual color testing would require more complex visual verification)
-        rank_1_found = False
-        rank_2_found = False
-        rank_3_found = False
-
-        for card in winner_cards:
-            rank = card.property("rank")
-            if rank == 1:
-                rank_1_found = True
-            elif rank == 2:
-                rank_2_found = True
-            elif rank == 3:
-                rank_3_found = True
-
-        assert rank_1_found, "Rank 1 card not found"
-        assert rank_2_found, "Rank 2 card not found"
-        assert rank_3_found, "Rank 3 card not found"
+        ranks = {card.property("rank") for card in winner_cards}
+        for rank in (1, 2, 3):
+            assert rank in ranks, f"Rank {rank} card not found"
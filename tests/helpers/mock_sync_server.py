@@ -1,6 +1,7 @@
 """Mock sync server for testing."""
 from __future__ import annotations
 
+import bisect
 import threading
 import time
 from datetime import datetime
@@ -28,6 +29,9 @@ class MockSyncServer:
         self.app = FastAPI(title="Mock Sync Server")
         self.storage: dict[str, dict[str, Any]] = {}  # entity_type -> entity_id -> data
         self.changes_log: list[EntityChange] = []
+        self._change_index: set[tuple[str, UUID]] = set()  # (entity_type, entity_id) in changes_log
+        self._timestamps: list[datetime] = []  # changes_log timestamps, in log order
+        self._log_in_time_order = True
         self.server_process: Optional[threading.Thread] = None
         self._setup_routes()
 
@@ -59,7 +63,7 @@ class MockSyncServer:
                         else:
                             # Apply the change
                             self.storage[entity_type][entity_id] = change.data
-                            self.changes_log.append(change)
+                            self.add_change(change)
                             processed_count += 1
                     else:
                         # Dependency validation failed
@@ -84,15 +88,20 @@ class MockSyncServer:
             """Handle pull requests."""
             # Filter changes by timestamp if provided
             filtered_changes = self.changes_log
+            start = 0
             if last_sync:
-                filtered_changes = [
-                    change for change in self.changes_log
-                    if change.timestamp > last_sync
-                ]
+                if self._log_in_time_order:
+                    # Changes newer than last_sync are a suffix of a time-ordered log
+                    start = bisect.bisect_right(self._timestamps, last_sync)
+                else:
+                    filtered_changes = [
+                        change for change in self.changes_log
+                        if change.timestamp > last_sync
+                    ]
 
             # Apply pagination
-            total_available = len(filtered_changes)
-            paginated_changes = filtered_changes[offset:offset + limit]
+            total_available = len(filtered_changes) - start
+            paginated_changes = filtered_changes[start + offset:start + offset + limit]
             has_more = (offset + limit) < total_available
 
             return SyncPullResponse(
@@ -117,8 +126,21 @@ class MockSyncServer:
         if self.server_process and self.server_process.is_alive():
             return
 
+        # "auto" picks uvloop and httptools when they are installed and falls
+        # back to asyncio and h11 otherwise (uvloop has no Windows build);
+        # access logging is off since every request would be formatted and dropped
+        config = uvicorn.Config(
+            self.app,
+            host="127.0.0.1",
+            port=self.port,
+            loop="auto",
+            http="auto",
+            log_level="critical",
+            access_log=False,
+        )
+
         def run_server() -> None:
-            uvicorn.run(self.app, host="127.0.0.1", port=self.port, log_level="critical")
+            uvicorn.Server(config).run()
 
         self.server_process = threading.Thread(target=run_server, daemon=True)
         self.server_process.start()
@@ -136,6 +158,17 @@ class MockSyncServer:
         """Reset server state."""
         self.storage.clear()
         self.changes_log.clear()
+        self._change_index.clear()
+        self._timestamps.clear()
+        self._log_in_time_order = True
+
+    def add_change(self, change: EntityChange) -> None:
+        """Append a change to the log and index it for has_change and pulls."""
+        if self._timestamps and change.timestamp < self._timestamps[-1]:
+            self._log_in_time_order = False
+        self.changes_log.append(change)
+        self._timestamps.append(change.timestamp)
+        self._change_index.add((change.entity_type, change.entity_id))
 
     def get_entity(self, entity_type: str, entity_id: str) -> Optional[dict[str, Any]]:
         """Get entity data from storage."""
@@ -143,10 +176,7 @@ class MockSyncServer:
 
     def has_change(self, entity_type: str, entity_id: UUID) -> bool:
         """Check if a change exists in the log."""
-        return any(
-            change.entity_type == entity_type and change.entity_id == entity_id
-            for change in self.changes_log
-        )
+        return (entity_type, entity_id) in self._change_index
 
 
 # Global mock server instance for testing
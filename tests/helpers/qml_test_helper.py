@@ -1,95 +1,217 @@
 """Helper classes for QML component testing."""
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Any
 
 import pytest
-from PySide6.QtCore import QObject, QTimer, QUrl
-from PySide6.QtQml import QQmlApplicationEngine, QQmlComponent, qmlRegisterType
+from PySide6.QtCore import QObject, QUrl
+from PySide6.QtQml import QQmlApplicationEngine, QQmlComponent, QQmlContext
 from PySide6.QtQuick import QQuickItem
-from PySide6.QtTest import QTest
+from PySide6.QtTest import QSignalSpy, QTest
 from PySide6.QtWidgets import QApplication
 
+# On-disk QML fixtures loaded by QMLTestHelper.create_qml_fixture
+QML_FIXTURES_DIR = Path(__file__).resolve().parent.parent / "gui" / "qml"
+
 
 class QMLTestHelper:
     """Base helper class for testing QML components."""
     
+    # (class name, property name) -> meta-property index, shared by all helpers
+    _property_indexes: dict[tuple[str, str], int] = {}
+    
     def __init__(self, qml_engine: QQmlApplicationEngine):
         """Initialize with QML engine."""
         self.engine = qml_engine
+        # id(root) -> (root, items under root bucketed by class name); holding
+        # the root keeps its id from being reused while the entry exists
+        self._child_cache: dict[int, tuple[QQuickItem, dict[str, list[QQuickItem]]]] = {}
+        # Contexts must outlive the objects created in them
+        self._contexts: list[QQmlContext] = []
+        # Fixture file name -> component compiled from it
+        self._fixture_components: dict[str, QQmlComponent] = {}
+        # Inline QML source -> component compiled from it
+        self._inline_components: dict[str, QQmlComponent] = {}
         
-    def create_qml_object(self, qml_code: str) -> QQuickItem:
-        """Create a QML object from QML code."""
-        # Register the components module
-        self.engine.addImportPath("src/jcselect/ui")
+    def clear_caches(self) -> None:
+        """Drop cached components, child lookups and contexts."""
+        self._child_cache.clear()
+        self._fixture_components.clear()
+        self._inline_components.clear()
+        self._contexts.clear()
         
-        # Create component from string using QQmlComponent
-        component = QQmlComponent(self.engine)
-        component.setData(qml_code.encode('utf-8'), QUrl())
-        
-        if component.isError():
-            errors = component.errors()
-            error_msgs = [f"Line {err.line()}: {err.description()}" for err in errors]
-            raise RuntimeError(f"QML errors: {'; '.join(error_msgs)}")
+    def create_qml_object(
+        self, qml_code: str, context_properties: dict[str, Any] | None = None
+    ) -> QQuickItem:
+        """Create a QML object from QML code.
+
+        context_properties are exposed to the object through a child context,
+        so Python data (e.g. lists of dicts) reaches QML without being
+        serialised into the source. Identical sources are compiled once
+        per helper.
+        """
+        component = self._inline_components.get(qml_code)
+        if component is None:
+            # Register the components module
+            self.engine.addImportPath("src/jcselect/ui")
+            
+            # Create component from string using QQmlComponent
+            component = QQmlComponent(self.engine)
+            component.setData(qml_code.encode('utf-8'), QUrl())
+            
+            self._raise_on_errors(component)
+            self._inline_components[qml_code] = component
         
         # Create object
-        obj = component.create()
+        if context_properties:
+            context = QQmlContext(self.engine.rootContext())
+            for name, value in context_properties.items():
+                context.setContextProperty(name, value)
+            self._contexts.append(context)
+            obj = component.create(context)
+        else:
+            obj = component.create()
         if obj is None:
             raise RuntimeError("Failed to create QML object")
             
         return obj
     
+    def create_qml_fixture(
+        self, filename: str, initial_properties: dict[str, Any] | None = None
+    ) -> QQuickItem:
+        """Create a QML object from a fixture file in tests/gui/qml.
+
+        The component is compiled once per file and helper; loading it by
+        file URL also lets the engine use its on-disk qmlcache. Per-test
+        variations are passed as initial properties rather than formatted
+        into the source.
+        """
+        component = self._fixture_components.get(filename)
+        if component is None:
+            self.engine.addImportPath("src/jcselect/ui")
+            component = QQmlComponent(
+                self.engine, QUrl.fromLocalFile(str(QML_FIXTURES_DIR / filename))
+            )
+            self._raise_on_errors(component)
+            self._fixture_components[filename] = component
+        
+        obj = component.createWithInitialProperties(initial_properties or {})
+        if obj is None:
+            raise RuntimeError(f"Failed to create QML object from {filename}")
+            
+        return obj
+    
+    @staticmethod
+    def _raise_on_errors(component: QQmlComponent) -> None:
+        """Raise RuntimeError listing the component's errors, if any."""
+        if component.isError():
+            errors = component.errors()
+            error_msgs = [f"Line {err.line()}: {err.description()}" for err in errors]
+            raise RuntimeError(f"QML errors: {'; '.join(error_msgs)}")
+    
     def find_child(self, parent: QQuickItem, class_name: str, name_hint: str = None) -> QQuickItem:
         """Find a child item by class name."""
-        if parent is None:
-            return None
-            
-        # Check if parent matches
-        if parent.metaObject().className() == class_name:
-            return parent
-            
-        # Search children recursively
-        for child in parent.childItems():
-            result = self.find_child(child, class_name, name_hint)
-            if result:
-                return result
-                
+        for item in self._walk(parent):
+            if item.metaObject().className() == class_name:
+                return item
         return None
+
+    @staticmethod
+    def _walk(root: QQuickItem | None) -> Iterator[QQuickItem]:
+        """Yield root and its descendant items depth-first, parents first.
+
+        Uses an explicit stack instead of recursion, so callers that stop at
+        the first match leave the rest of the tree unvisited.
+        """
+        if root is None:
+            return
+        stack = [root]
+        while stack:
+            item = stack.pop()
+            yield item
+            stack.extend(reversed(item.childItems()))
     
-    def find_children(self, parent: QQuickItem, class_name: str) -> list[QQuickItem]:
-        """Find all child items by class name."""
+    def _class_index(self, root: QQuickItem) -> dict[str, list[QQuickItem]]:
+        """Return root and its descendant items bucketed by class name.
+
+        The tree is walked once per root; each bucket keeps the depth-first
+        order that find_child/find_children search in.
+        """
+        cached = self._child_cache.get(id(root))
+        if cached is not None and cached[0] is root:
+            return cached[1]
+
+        index: dict[str, list[QQuickItem]] = {}
+        for item in self._walk(root):
+            index.setdefault(item.metaObject().className(), []).append(item)
+        self._child_cache[id(root)] = (root, index)
+        return index
+
+    def find_child_cached(
+        self, parent: QQuickItem, class_name: str, object_name: str | None = None
+    ) -> QQuickItem:
+        """Find a child item by class name, walking each parent's tree once.
+
+        If object_name is given, only items with that objectName match.
+        Only use this for trees whose structure does not change after creation,
+        or call invalidate_children after changing it.
+        """
+        items = self.find_children_cached(parent, class_name, object_name)
+        return items[0] if items else None
+
+    def find_children_cached(
+        self, parent: QQuickItem, class_name: str, object_name: str | None = None
+    ) -> list[QQuickItem]:
+        """Find all child items by class name, walking each parent's tree once.
+
+        The same object_name filter and caveat as for find_child_cached apply.
+        """
         if parent is None:
             return []
-            
-        results = []
-        
-        # Check if parent matches
-        if parent.metaObject().className() == class_name:
-            results.append(parent)
-            
-        # Search children recursively
-        for child in parent.childItems():
-            results.extend(self.find_children(child, class_name))
-                
-        return results
+
+        items = self._class_index(parent).get(class_name, ())
+        if object_name is not None:
+            return [item for item in items if item.objectName() == object_name]
+        return list(items)
+
+    def invalidate_children(self, root: QQuickItem) -> None:
+        """Forget the cached lookups for root after its item tree changed."""
+        self._child_cache.pop(id(root), None)
+
+    def find_children(self, parent: QQuickItem, class_name: str) -> list[QQuickItem]:
+        """Find all child items by class name."""
+        return [
+            item for item in self._walk(parent)
+            if item.metaObject().className() == class_name
+        ]
     
     def find_child_by_property(self, parent: QQuickItem, prop_name: str, prop_value: Any) -> QQuickItem:
         """Find child by property value."""
-        if parent is None:
-            return None
-            
-        # Check if parent matches
-        if parent.property(prop_name) == prop_value:
-            return parent
-            
-        # Search children recursively
-        for child in parent.childItems():
-            result = self.find_child_by_property(child, prop_name, prop_value)
-            if result:
-                return result
-                
+        for item in self._walk(parent):
+            if item.property(prop_name) == prop_value:
+                return item
         return None
     
+    def get_properties(self, obj: QObject, names: tuple[str, ...]) -> dict[str, Any]:
+        """Read several properties of obj through its meta-object.
+
+        Property indexes are looked up once per class; unknown names read
+        as None, like QObject.property.
+        """
+        meta = obj.metaObject()
+        class_name = meta.className()
+        values: dict[str, Any] = {}
+        for name in names:
+            key = (class_name, name)
+            index = self._property_indexes.get(key)
+            if index is None:
+                index = self._property_indexes[key] = meta.indexOfProperty(name)
+            values[name] = meta.property(index).read(obj) if index != -1 else None
+        return values
+    
     def click_item(self, item: QQuickItem) -> None:
         """Simulate clicking on an item."""
         if item is None:
@@ -107,6 +229,26 @@ class QMLTestHelper:
             # Fallback to simple click without position
             QTest.mouseClick(item.window(), 1)
     
+    def set_properties_batch(self, obj: QObject, **properties: Any) -> None:
+        """Set several properties on obj, then process events once."""
+        for name, value in properties.items():
+            obj.setProperty(name, value)
+        self.process_events()
+    
+    @contextmanager
+    def wait_for_signal(
+        self, obj: QObject, signal_name: str, timeout: int = 1000
+    ) -> Iterator[QSignalSpy]:
+        """Fail unless obj emits signal_name during or shortly after the block.
+
+        Returns as soon as the signal has been seen instead of pumping the
+        event loop for a fixed time.
+        """
+        spy = QSignalSpy(getattr(obj, signal_name))
+        yield spy
+        if spy.count() == 0 and not spy.wait(timeout):
+            pytest.fail(f"{signal_name} was not emitted within {timeout} ms")
+    
     def process_events(self) -> None:
         """Process pending events."""
         QApplication.processEvents()
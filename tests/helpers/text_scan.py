@@ -0,0 +1,33 @@
+"""Helpers for checking source files for literal substrings."""
+from __future__ import annotations
+
+import mmap
+from collections.abc import Iterable
+
+
+class MappedSource(mmap.mmap):
+    """Read-only memory map of a source file with substring membership.
+
+    A plain ``mmap`` compares ``in`` against single byte values, so
+    ``b"needle" in mapped`` would always be false; this uses ``find`` instead.
+    The map still exposes the buffer protocol for ``re`` byte patterns.
+    """
+
+    def __contains__(self, needle: object) -> bool:
+        """Return True if the bytes needle occurs anywhere in the mapping."""
+        if not isinstance(needle, bytes | bytearray):
+            raise TypeError(f"MappedSource needs a bytes needle, got {type(needle).__name__}")
+        return self.find(needle) != -1
+
+
+def assert_contains_all(content: str | bytes | MappedSource, needles: Iterable[str]) -> None:
+    """Assert every needle occurs in content, listing all that are missing.
+
+    Bytes content, such as a MappedSource, is searched for the UTF-8
+    encoding of each needle.
+    """
+    if isinstance(content, str):
+        missing = [needle for needle in needles if needle not in content]
+    else:
+        missing = [needle for needle in needles if needle.encode("utf-8") not in content]
+    assert not missing, f"Missing from content: {missing}"
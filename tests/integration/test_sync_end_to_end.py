@@ -143,7 +143,7 @@ async def test_sync_pagination_end_to_end(mock_server, sync_engine, temp_queue):
     
     # Manually add many changes to server to test pagination
     for i in range(25):  # More than one page (page_size=10)
-        mock_server.changes_log.append(
+        mock_server.add_change(
             type('MockChange', (), {
                 'id': uuid4(),
                 'entity_type': 'User',